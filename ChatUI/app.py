@@ -1,17 +1,73 @@
 from flask import Flask, render_template, request, jsonify, session, send_file
 from datetime import datetime
+from collections import OrderedDict
+import threading
 import requests
+from requests.adapters import HTTPAdapter
 import uuid
 import os
+import io
+import time
 from pdf_generator import generate_chat_pdf
 
 app = Flask(__name__)
 app.secret_key = 'your-secret-key-change-this'  # Change this in production
 
+# Compact, unsorted JSON responses (Flask pretty-prints in debug mode by default)
+app.json.compact = True
+app.json.sort_keys = False
+
 # Configuration
 FASTAPI_URL = "http://127.0.0.1:8000"
+# (connect, read) timeouts - fail fast when the API is down instead of
+# holding the worker for the full LLM generation budget
+FASTAPI_TIMEOUT = (3.05, 30)
 UPLOAD_FOLDER = 'exports'
 
+# Shared HTTP session so keep-alive connections to FastAPI are reused. No
+# retries: /chat is a non-idempotent POST, and retrying connect errors would
+# multiply the fail-fast connect timeout above
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    max_retries=0
+))
+
+# Server-side chat history keyed by session_id; only the id lives in the cookie
+MAX_STORED_SESSIONS = 1024
+CHAT_HISTORY_STORE = OrderedDict()
+_store_lock = threading.Lock()
+
+def get_chat_history(session_id):
+    """Get (or create) the chat history list for a session, evicting the least recently used"""
+    with _store_lock:
+        history = CHAT_HISTORY_STORE.get(session_id)
+        if history is None:
+            history = CHAT_HISTORY_STORE[session_id] = []
+            if len(CHAT_HISTORY_STORE) > MAX_STORED_SESSIONS:
+                CHAT_HISTORY_STORE.popitem(last=False)
+        else:
+            CHAT_HISTORY_STORE.move_to_end(session_id)
+        return history
+
+# Random bytes for new session ids, read from os.urandom in batches of 64 ids
+_SESSION_ID_BATCH = 64
+_id_pool = b''
+_id_lock = threading.Lock()
+
+def new_session_id():
+    """Return a random (version 4) UUID string, drawing from a batched urandom pool"""
+    global _id_pool
+    with _id_lock:
+        if not _id_pool:
+            _id_pool = os.urandom(16 * _SESSION_ID_BATCH)
+        raw, _id_pool = _id_pool[:16], _id_pool[16:]
+    return str(uuid.UUID(bytes=raw, version=4))
+
+# Header clock payload, shared by every poll within the same second
+_TIME_CACHE = {'t': 0, 'payload': None}
+
 # Ensure exports directory exists
 if not os.path.exists(UPLOAD_FOLDER):
     os.makedirs(UPLOAD_FOLDER)
@@ -20,14 +76,11 @@ if not os.path.exists(UPLOAD_FOLDER):
 def index():
     """Main chat interface"""
     if 'session_id' not in session:
-        session['session_id'] = str(uuid.uuid4())
-    
-    if 'chat_history' not in session:
-        session['chat_history'] = []
+        session['session_id'] = new_session_id()
     
     return render_template('chat.html', 
                          session_id=session['session_id'],
-                         chat_history=session['chat_history'])
+                         chat_history=get_chat_history(session['session_id']))
 
 @app.route('/send_message', methods=['POST'])
 def send_message():
@@ -40,8 +93,12 @@ def send_message():
         if not user_message.strip():
             return jsonify({'error': 'Message cannot be empty'}), 400
         
+        # Without a session cookie there is no history to record into
+        if not session_id:
+            return jsonify({'error': 'No chat session. Please reload the page.'}), 400
+        
         # Record start time for API call
-        start_time = datetime.now()
+        t0 = time.monotonic()
         
         # Call FastAPI endpoint
         payload = {
@@ -49,39 +106,42 @@ def send_message():
             'message': user_message
         }
         
-        response = requests.post(f"{FASTAPI_URL}/chat", 
-                               json=payload, 
-                               timeout=30)
+        response = SESSION.post(f"{FASTAPI_URL}/chat", 
+                              json=payload, 
+                              timeout=FASTAPI_TIMEOUT)
         
         # Calculate response time
-        end_time = datetime.now()
-        response_time = (end_time - start_time).total_seconds()
+        response_time = time.monotonic() - t0
         
         if response.status_code == 200:
             api_response = response.json()
+            resp_text = api_response.get('response', '')
+            in_tok = api_response.get('input_tokens', 0)
+            out_tok = api_response.get('output_tokens', 0)
+            response_time = round(response_time, 2)
             
             # Store in session history
+            now = datetime.now()
+            now_iso = now.isoformat()
             chat_entry = {
                 'user_message': user_message,
-                'ai_response': api_response.get('response', ''),
-                'timestamp': datetime.now().isoformat(),
-                'response_time': round(response_time, 2),
-                'input_tokens': api_response.get('input_tokens', 0),
-                'output_tokens': api_response.get('output_tokens', 0)
+                'ai_response': resp_text,
+                'timestamp': now_iso,
+                'timestamp_display': now.strftime('%Y-%m-%d %H:%M:%S'),
+                'response_time': response_time,
+                'input_tokens': in_tok,
+                'output_tokens': out_tok
             }
             
-            if 'chat_history' not in session:
-                session['chat_history'] = []
-            session['chat_history'].append(chat_entry)
-            session.modified = True
+            get_chat_history(session_id).append(chat_entry)
             
             return jsonify({
                 'success': True,
-                'response': api_response.get('response', ''),
-                'response_time': round(response_time, 2),
-                'input_tokens': api_response.get('input_tokens', 0),
-                'output_tokens': api_response.get('output_tokens', 0),
-                'timestamp': datetime.now().isoformat()
+                'response': resp_text,
+                'response_time': response_time,
+                'input_tokens': in_tok,
+                'output_tokens': out_tok,
+                'timestamp': now_iso
             })
         else:
             return jsonify({
@@ -100,8 +160,8 @@ def send_message():
 def export_pdf():
     """Export chat history as PDF"""
     try:
-        chat_history = session.get('chat_history', [])
-        session_id = session.get('session_id', 'unknown')
+        session_id = session.get('session_id')
+        chat_history = get_chat_history(session_id) if session_id else []
         
         print(f"Debug - Session ID: {session_id}")
         print(f"Debug - Chat history length: {len(chat_history)}")
@@ -117,10 +177,11 @@ def export_pdf():
                 }
             }), 400
         
-        # Generate PDF
-        pdf_path = generate_chat_pdf(chat_history, session_id)
+        # Generate PDF in memory - no temp file write/read round-trip
+        pdf_buffer = generate_chat_pdf(chat_history, session_id, io.BytesIO())
+        pdf_buffer.seek(0)
         
-        return send_file(pdf_path, 
+        return send_file(pdf_buffer, 
                         as_attachment=True, 
                         download_name=f'chat_export_{session_id[:8]}.pdf',
                         mimetype='application/pdf')
@@ -132,19 +193,23 @@ def export_pdf():
 @app.route('/clear_chat', methods=['POST'])
 def clear_chat():
     """Clear current chat session"""
-    session['chat_history'] = []
-    session.modified = True
+    session_id = session.get('session_id')
+    if session_id:
+        get_chat_history(session_id).clear()
     return jsonify({'success': True})
 
 @app.route('/get_current_time')
 def get_current_time():
-    """Get current time for header display"""
-    now = datetime.now()
-    return jsonify({
-        'time': now.strftime('%H:%M:%S'),
-        'date': now.strftime('%Y-%m-%d'),
-        'timezone': now.astimezone().tzname()
-    })
+    """Get current time for header display (recomputed at most once per second)"""
+    ts = int(time.time())
+    if ts != _TIME_CACHE['t']:
+        now = datetime.now()
+        _TIME_CACHE.update(t=ts, payload={
+            'time': now.strftime('%H:%M:%S'),
+            'date': now.strftime('%Y-%m-%d'),
+            'timezone': now.astimezone().tzname()
+        })
+    return jsonify(_TIME_CACHE['payload'])
 
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
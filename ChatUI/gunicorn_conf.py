@@ -0,0 +1,18 @@
+import os
+
+# Gunicorn settings for the chat UI: gunicorn -c gunicorn_conf.py wsgi:app
+bind = os.environ.get("CHATUI_BIND", "0.0.0.0:5000")
+
+# A single gevent worker multiplexes the long /send_message calls (mostly
+# waiting on the LLM) instead of tying up one worker per in-flight request.
+# Chat history lives in the worker's memory (CHAT_HISTORY_STORE), so this must
+# stay at one worker: all workers accept from the same socket, and no load
+# balancer can route a session to a particular worker. Running more workers
+# needs the history moved to a shared store such as Redis first.
+worker_class = "gevent"
+workers = 1
+worker_connections = 1000
+
+# Longer than the FastAPI read timeout in app.py
+timeout = 60
+keepalive = 5
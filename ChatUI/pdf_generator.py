@@ -5,20 +5,90 @@ from reportlab.lib.units import inch
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_LEFT, TA_RIGHT, TA_CENTER
 from datetime import datetime
-import os
-import tempfile
 
-def generate_chat_pdf(chat_history, session_id):
+# Styles are built once at import and shared by every export
+_STYLES = getSampleStyleSheet()
+
+# Custom styles
+_TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=_STYLES['Heading1'],
+    fontSize=24,
+    spaceAfter=30,
+    textColor=colors.Color(0.545, 0.361, 0.965),  # Purple color
+    alignment=TA_CENTER
+)
+
+_HEADER_STYLE = ParagraphStyle(
+    'CustomHeader',
+    parent=_STYLES['Heading2'],
+    fontSize=14,
+    spaceBefore=20,
+    spaceAfter=10,
+    textColor=colors.Color(0.4, 0.4, 0.4)
+)
+
+_USER_STYLE = ParagraphStyle(
+    'UserMessage',
+    parent=_STYLES['Normal'],
+    fontSize=11,
+    spaceBefore=10,
+    spaceAfter=5,
+    leftIndent=20,
+    rightIndent=0,
+    textColor=colors.Color(0.2, 0.2, 0.2),
+    backColor=colors.Color(0.95, 0.95, 1.0),
+    borderColor=colors.Color(0.545, 0.361, 0.965),
+    borderWidth=1,
+    borderPadding=10
+)
+
+_AI_STYLE = ParagraphStyle(
+    'AIMessage',
+    parent=_STYLES['Normal'],
+    fontSize=11,
+    spaceBefore=10,
+    spaceAfter=5,
+    leftIndent=0,
+    rightIndent=20,
+    textColor=colors.Color(0.2, 0.2, 0.2),
+    backColor=colors.Color(0.98, 0.98, 0.98),
+    borderColor=colors.Color(0.8, 0.8, 0.8),
+    borderWidth=1,
+    borderPadding=10
+)
+
+_META_STYLE = ParagraphStyle(
+    'MetaInfo',
+    parent=_STYLES['Normal'],
+    fontSize=8,
+    textColor=colors.Color(0.6, 0.6, 0.6),
+    spaceAfter=10
+)
+
+_FOOTER_STYLE = ParagraphStyle(
+    'Footer',
+    parent=_STYLES['Normal'],
+    fontSize=8,
+    textColor=colors.Color(0.5, 0.5, 0.5),
+    alignment=TA_CENTER
+)
+
+# Fixed markup reused for every conversation entry
+_USER_PREFIX = "<b>👤 User:</b><br/>"
+_AI_PREFIX = "<b>🤖 AI Assistant:</b><br/>"
+_SEP_TEXT = "─" * 50
+
+def generate_chat_pdf(chat_history, session_id, output):
     """
     Generate a PDF export of the chat conversation
+
+    The PDF is written straight into output (a writable binary file-like
+    object, e.g. io.BytesIO), which is returned.
     """
-    # Create temporary file
-    with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
-        pdf_path = tmp_file.name
-    
     # Create the PDF document
     doc = SimpleDocTemplate(
-        pdf_path,
+        output,
         pagesize=A4,
         rightMargin=72,
         leftMargin=72,
@@ -26,71 +96,11 @@ def generate_chat_pdf(chat_history, session_id):
         bottomMargin=18
     )
     
-    # Get styles
-    styles = getSampleStyleSheet()
-    
-    # Custom styles
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=24,
-        spaceAfter=30,
-        textColor=colors.Color(0.545, 0.361, 0.965),  # Purple color
-        alignment=TA_CENTER
-    )
-    
-    header_style = ParagraphStyle(
-        'CustomHeader',
-        parent=styles['Heading2'],
-        fontSize=14,
-        spaceBefore=20,
-        spaceAfter=10,
-        textColor=colors.Color(0.4, 0.4, 0.4)
-    )
-    
-    user_style = ParagraphStyle(
-        'UserMessage',
-        parent=styles['Normal'],
-        fontSize=11,
-        spaceBefore=10,
-        spaceAfter=5,
-        leftIndent=20,
-        rightIndent=0,
-        textColor=colors.Color(0.2, 0.2, 0.2),
-        backColor=colors.Color(0.95, 0.95, 1.0),
-        borderColor=colors.Color(0.545, 0.361, 0.965),
-        borderWidth=1,
-        borderPadding=10
-    )
-    
-    ai_style = ParagraphStyle(
-        'AIMessage',
-        parent=styles['Normal'],
-        fontSize=11,
-        spaceBefore=10,
-        spaceAfter=5,
-        leftIndent=0,
-        rightIndent=20,
-        textColor=colors.Color(0.2, 0.2, 0.2),
-        backColor=colors.Color(0.98, 0.98, 0.98),
-        borderColor=colors.Color(0.8, 0.8, 0.8),
-        borderWidth=1,
-        borderPadding=10
-    )
-    
-    meta_style = ParagraphStyle(
-        'MetaInfo',
-        parent=styles['Normal'],
-        fontSize=8,
-        textColor=colors.Color(0.6, 0.6, 0.6),
-        spaceAfter=10
-    )
-    
     # Build the PDF content
     story = []
     
     # Title
-    story.append(Paragraph("AI Assistant Chat Export", title_style))
+    story.append(Paragraph("AI Assistant Chat Export", _TITLE_STYLE))
     story.append(Spacer(1, 12))
     
     # Export info
@@ -118,83 +128,56 @@ def generate_chat_pdf(chat_history, session_id):
     story.append(Spacer(1, 20))
     
     # Chat messages
-    story.append(Paragraph("Chat Conversation", header_style))
+    story.append(Paragraph("Chat Conversation", _HEADER_STYLE))
     story.append(Spacer(1, 12))
     
     for i, entry in enumerate(chat_history, 1):
         # Conversation separator
         if i > 1:
             story.append(Spacer(1, 15))
-            story.append(Paragraph("─" * 50, meta_style))
+            story.append(Paragraph(_SEP_TEXT, _META_STYLE))
             story.append(Spacer(1, 10))
         
         # Timestamp
-        timestamp = datetime.fromisoformat(entry['timestamp']).strftime('%Y-%m-%d %H:%M:%S')
-        story.append(Paragraph(f"<b>Conversation {i} - {timestamp}</b>", meta_style))
+        timestamp = entry.get('timestamp_display') or entry['timestamp'][:19].replace('T', ' ')
+        story.append(Paragraph(f"<b>Conversation {i} - {timestamp}</b>", _META_STYLE))
         story.append(Spacer(1, 8))
         
         # User message
-        user_text = escape_html(entry['user_message'])
-        story.append(Paragraph(f"<b>👤 User:</b><br/>{user_text}", user_style))
+        story.append(Paragraph(_USER_PREFIX + escape_html(entry['user_message']), _USER_STYLE))
         
         # AI response
-        ai_text = escape_html(entry['ai_response'])
-        story.append(Paragraph(f"<b>🤖 AI Assistant:</b><br/>{ai_text}", ai_style))
+        story.append(Paragraph(_AI_PREFIX + escape_html(entry['ai_response']), _AI_STYLE))
         
         # Response metadata
-        meta_info = [
-            f"Response Time: {entry['response_time']}s",
-            f"Input Tokens: {entry['input_tokens']}",
-            f"Output Tokens: {entry['output_tokens']}"
-        ]
-        story.append(Paragraph(" | ".join(meta_info), meta_style))
+        story.append(Paragraph(
+            f"Response Time: {entry['response_time']}s | "
+            f"Input Tokens: {entry['input_tokens']} | "
+            f"Output Tokens: {entry['output_tokens']}",
+            _META_STYLE
+        ))
     
     # Footer
     story.append(Spacer(1, 30))
-    footer_style = ParagraphStyle(
-        'Footer',
-        parent=styles['Normal'],
-        fontSize=8,
-        textColor=colors.Color(0.5, 0.5, 0.5),
-        alignment=TA_CENTER
-    )
-    story.append(Paragraph("Generated by AI Assistant Chat Interface", footer_style))
+    story.append(Paragraph("Generated by AI Assistant Chat Interface", _FOOTER_STYLE))
     
     # Build PDF
     doc.build(story)
     
-    return pdf_path
+    return output
+
+# HTML escaping + newline handling applied in a single translate pass
+_HTML_TRANS = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#39;',
+    '\n': '<br/>'
+})
 
 def escape_html(text):
     """
     Escape HTML characters for PDF generation
     """
-    if not text:
-        return ""
-    
-    # Basic HTML escaping
-    text = text.replace('&', '&amp;')
-    text = text.replace('<', '&lt;')
-    text = text.replace('>', '&gt;')
-    text = text.replace('"', '&quot;')
-    text = text.replace("'", '&#39;')
-    
-    # Handle newlines
-    text = text.replace('\n', '<br/>')
-    
-    return text
-
-def cleanup_temp_files(file_path, max_age_hours=1):
-    """
-    Clean up temporary PDF files older than max_age_hours
-    """
-    try:
-        if os.path.exists(file_path):
-            file_age = datetime.now() - datetime.fromtimestamp(os.path.getctime(file_path))
-            if file_age.total_seconds() > max_age_hours * 3600:
-                os.remove(file_path)
-                return True
-    except Exception as e:
-        print(f"Error cleaning up temp file {file_path}: {e}")
-    
-    return False
\ No newline at end of file
+    return text.translate(_HTML_TRANS) if text else ""
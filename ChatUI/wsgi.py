@@ -0,0 +1,8 @@
+# Patch the stdlib before anything else imports socket/ssl so that
+# requests calls to FastAPI yield to other greenlets instead of blocking
+from gevent import monkey
+monkey.patch_all()
+
+from app import app  # noqa: E402
+
+application = app
@@ -10,24 +10,22 @@ import logging
 import time
 from typing import Dict, Any
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+import orjson
+from fastapi import APIRouter, HTTPException, Request, Response, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 
-from ..core.chat_manager import ChatManager
-from ..dependencies import (
-    get_chat_manager,
-    validate_chat_request,
-    get_request_id,
-    get_app_settings
-)
+from ..dependencies import ChatContextDep, validate_chat_request
 from ..database.schemas import ChatRequest, ChatResponse
-from ..config import Settings
 from ..utils.exceptions import ChatBotException, ValidationError, LLMError, ToolError
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Pre-encoded clear_session body; only the JSON-encoded ids are spliced in
+_CLEAR_OK_TMPL = b'{"message":"Session cleared successfully","session_id":%s,"request_id":%s}'
+
 
 class ChatRequestModel(BaseModel):
     """Chat request model for API endpoint"""
@@ -71,11 +69,10 @@ class ChatResponseModel(BaseModel):
 
 @router.post(
     "/chat",
-    response_model=ChatResponseModel,
     summary="Process chat message",
     description="Process a user message and return AI assistant response with token counts",
     responses={
-        200: {"description": "Successful response with AI message"},
+        200: {"model": ChatResponseModel, "description": "Successful response with AI message"},
         400: {"description": "Invalid request data"},
         408: {"description": "Request timeout or session expired"},
         429: {"description": "Rate limit exceeded"},
@@ -85,10 +82,8 @@ class ChatResponseModel(BaseModel):
 async def chat_endpoint(
     chat_request: ChatRequestModel,
     request: Request,
-    chat_manager: ChatManager = Depends(get_chat_manager),
-    request_id: str = Depends(get_request_id),
-    settings: Settings = Depends(get_app_settings)
-) -> ChatResponseModel:
+    ctx: ChatContextDep
+) -> ORJSONResponse:
     """
     Process chat message and return AI response.
     
@@ -102,19 +97,20 @@ async def chat_endpoint(
     """
     
     start_time = time.time()
+    sid_tag = chat_request.session_id[:16]
     
     try:
-        logger.info(f"Processing chat request - Session: {chat_request.session_id[:16]}... Request: {request_id}")
+        logger.info("Processing chat request - Session: %s... Request: %s", sid_tag, ctx.request_id)
         
         # Validate request (includes rate limiting, content filtering, etc.)
         validated_session_id, validated_message = validate_chat_request(
             chat_request.session_id,
             chat_request.message,
             request,
-            settings
+            ctx.settings
         )
         
-        logger.debug(f"Request validated for session {validated_session_id[:16]}...")
+        logger.debug("Request validated for session %s...", sid_tag)
         
         # Create internal chat request
         internal_request = ChatRequest(
@@ -123,54 +119,56 @@ async def chat_endpoint(
         )
         
         # Process chat message through chat manager
-        chat_response = await chat_manager.process_message(internal_request)
+        chat_response = await ctx.chat_manager.process_message(internal_request)
         
         # Calculate response time
         response_time = time.time() - start_time
         
         logger.info(
-            f"Chat processed successfully - Session: {validated_session_id[:16]}... "
-            f"Response time: {response_time:.2f}s, "
-            f"Input tokens: {chat_response.input_tokens}, "
-            f"Output tokens: {chat_response.output_tokens}, "
-            f"Tool called: {chat_response.tool_called}"
+            "Chat processed successfully - Session: %s... "
+            "Response time: %.2fs, Input tokens: %d, Output tokens: %d, Tool called: %s",
+            sid_tag,
+            response_time,
+            chat_response.input_tokens,
+            chat_response.output_tokens,
+            chat_response.tool_called
         )
         
-        # Return formatted response
-        return ChatResponseModel(
-            response=chat_response.response,
-            input_tokens=chat_response.input_tokens,
-            output_tokens=chat_response.output_tokens,
-            response_time_seconds=round(response_time, 3),
-            session_id=validated_session_id,
-            request_id=request_id,
-            tool_called=chat_response.tool_called,
-            tool_name=chat_response.tool_name
-        )
+        # Return formatted response (serialized directly, no response_model re-validation)
+        return ORJSONResponse({
+            "response": chat_response.response,
+            "input_tokens": chat_response.input_tokens,
+            "output_tokens": chat_response.output_tokens,
+            "response_time_seconds": round(response_time, 3),
+            "session_id": validated_session_id,
+            "request_id": ctx.request_id,
+            "tool_called": chat_response.tool_called,
+            "tool_name": chat_response.tool_name
+        })
         
     except ValidationError as e:
-        logger.warning(f"Validation error for session {chat_request.session_id[:16]}...: {e.detail}")
+        logger.warning("Validation error for session %s...: %s", sid_tag, e.detail)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=e.detail
         )
     
     except LLMError as e:
-        logger.error(f"LLM error for session {chat_request.session_id[:16]}...: {e.detail}")
+        logger.error("LLM error for session %s...: %s", sid_tag, e.detail)
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="AI service temporarily unavailable. Please try again."
         )
     
     except ToolError as e:
-        logger.error(f"Tool error for session {chat_request.session_id[:16]}...: {e.detail}")
+        logger.error("Tool error for session %s...: %s", sid_tag, e.detail)
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail="Unable to process tool request. Please try again or rephrase your request."
         )
     
     except ChatBotException as e:
-        logger.error(f"ChatBot error for session {chat_request.session_id[:16]}...: {e.detail}")
+        logger.error("ChatBot error for session %s...: %s", sid_tag, e.detail)
         raise HTTPException(
             status_code=e.status_code,
             detail=e.detail
@@ -182,8 +180,10 @@ async def chat_endpoint(
     
     except Exception as e:
         logger.error(
-            f"Unexpected error processing chat request - Session: {chat_request.session_id[:16]}... "
-            f"Request: {request_id} - Error: {str(e)}",
+            "Unexpected error processing chat request - Session: %s... Request: %s - Error: %s",
+            sid_tag,
+            ctx.request_id,
+            e,
             exc_info=True
         )
         raise HTTPException(
@@ -192,6 +192,78 @@ async def chat_endpoint(
         )
 
 
+@router.post(
+    "/chat/stream",
+    summary="Stream chat message response",
+    description="Process a user message and stream the AI response as server-sent events",
+    responses={
+        200: {"description": "Event stream of response chunks, ending with a 'done' event"},
+        400: {"description": "Invalid request data"},
+        429: {"description": "Rate limit exceeded"}
+    }
+)
+async def chat_stream_endpoint(
+    chat_request: ChatRequestModel,
+    request: Request,
+    ctx: ChatContextDep
+) -> StreamingResponse:
+    """
+    Process chat message and stream the AI response.
+    
+    Runs the same pipeline as /chat, but sends each guardrail-checked chunk
+    of the response as soon as it is generated. Each event is a JSON object:
+    'token' events carry response text, the final 'done' event carries token
+    counts and tool metadata, and an 'error' event replaces it on failure.
+    """
+    
+    sid_tag = chat_request.session_id[:16]
+    
+    logger.info("Streaming chat request - Session: %s... Request: %s", sid_tag, ctx.request_id)
+    
+    # Validate up front so request errors still get a proper status code
+    try:
+        validated_session_id, validated_message = validate_chat_request(
+            chat_request.session_id,
+            chat_request.message,
+            request,
+            ctx.settings
+        )
+    except ValidationError as e:
+        logger.warning("Validation error for session %s...: %s", sid_tag, e.detail)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=e.detail
+        )
+    
+    internal_request = ChatRequest(
+        session_id=validated_session_id,
+        message=validated_message
+    )
+    
+    async def event_stream():
+        try:
+            async for chunk in ctx.chat_manager.process_message_stream(internal_request):
+                if chunk['type'] == 'done':
+                    chunk['request_id'] = ctx.request_id
+                yield b"data: " + orjson.dumps(chunk) + b"\n\n"
+        
+        except ChatBotException as e:
+            # Headers are already sent, so the failure is reported in-band
+            logger.error("Streaming failed for session %s...: %s", sid_tag, e.detail)
+            detail = e.detail if isinstance(e, ValidationError) else "An error occurred while generating the response."
+            yield b"data: " + orjson.dumps({
+                "type": "error",
+                "detail": detail,
+                "request_id": ctx.request_id
+            }) + b"\n\n"
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.get(
     "/chat/session/{session_id}",
     summary="Get session information",
@@ -204,15 +276,14 @@ async def chat_endpoint(
 )
 async def get_session_info(
     session_id: str,
-    chat_manager: ChatManager = Depends(get_chat_manager),
-    request_id: str = Depends(get_request_id)
+    ctx: ChatContextDep
 ) -> Dict[str, Any]:
     """Get information about a chat session"""
     
     try:
-        logger.info(f"Getting session info - Session: {session_id[:16]}... Request: {request_id}")
+        logger.info("Getting session info - Session: %s... Request: %s", session_id[:16], ctx.request_id)
         
-        session_info = await chat_manager.get_session_info(session_id)
+        session_info = await ctx.chat_manager.get_session_info(session_id)
         
         if not session_info:
             raise HTTPException(
@@ -226,7 +297,7 @@ async def get_session_info(
         raise
     
     except Exception as e:
-        logger.error(f"Error getting session info - Session: {session_id[:16]}... Error: {str(e)}")
+        logger.error("Error getting session info - Session: %s... Error: %s", session_id[:16], e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Unable to retrieve session information"
@@ -245,15 +316,14 @@ async def get_session_info(
 )
 async def clear_session(
     session_id: str,
-    chat_manager: ChatManager = Depends(get_chat_manager),
-    request_id: str = Depends(get_request_id)
-) -> Dict[str, str]:
+    ctx: ChatContextDep
+) -> Response:
     """Clear a chat session and its history"""
     
     try:
-        logger.info(f"Clearing session - Session: {session_id[:16]}... Request: {request_id}")
+        logger.info("Clearing session - Session: %s... Request: %s", session_id[:16], ctx.request_id)
         
-        success = await chat_manager.clear_session(session_id)
+        success = await ctx.chat_manager.clear_session(session_id)
         
         if not success:
             raise HTTPException(
@@ -261,19 +331,18 @@ async def clear_session(
                 detail="Session not found or could not be cleared"
             )
         
-        logger.info(f"Session cleared successfully - Session: {session_id[:16]}...")
+        logger.info("Session cleared successfully - Session: %s...", session_id[:16])
         
-        return {
-            "message": "Session cleared successfully",
-            "session_id": session_id,
-            "request_id": request_id
-        }
+        return Response(
+            content=_CLEAR_OK_TMPL % (orjson.dumps(session_id), orjson.dumps(ctx.request_id)),
+            media_type="application/json"
+        )
         
     except HTTPException:
         raise
     
     except Exception as e:
-        logger.error(f"Error clearing session - Session: {session_id[:16]}... Error: {str(e)}")
+        logger.error("Error clearing session - Session: %s... Error: %s", session_id[:16], e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Unable to clear session"
@@ -290,28 +359,27 @@ async def clear_session(
     }
 )
 async def list_sessions(
-    chat_manager: ChatManager = Depends(get_chat_manager),
-    request_id: str = Depends(get_request_id),
+    ctx: ChatContextDep,
     limit: int = 50,
     offset: int = 0
 ) -> Dict[str, Any]:
     """Get list of active sessions (for admin/monitoring)"""
     
     try:
-        logger.info(f"Listing sessions - Request: {request_id} - Limit: {limit}, Offset: {offset}")
+        logger.info("Listing sessions - Request: %s - Limit: %d, Offset: %d", ctx.request_id, limit, offset)
         
-        sessions = await chat_manager.list_sessions(limit=limit, offset=offset)
+        sessions = await ctx.chat_manager.list_sessions(limit=limit, offset=offset)
         
         return {
             "sessions": sessions,
             "total": len(sessions),
             "limit": limit,
             "offset": offset,
-            "request_id": request_id
+            "request_id": ctx.request_id
         }
         
     except Exception as e:
-        logger.error(f"Error listing sessions - Request: {request_id} - Error: {str(e)}")
+        logger.error("Error listing sessions - Request: %s - Error: %s", ctx.request_id, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Unable to list sessions"
@@ -328,24 +396,23 @@ async def list_sessions(
     }
 )
 async def get_chat_stats(
-    chat_manager: ChatManager = Depends(get_chat_manager),
-    request_id: str = Depends(get_request_id)
+    ctx: ChatContextDep
 ) -> Dict[str, Any]:
     """Get chat system statistics"""
     
     try:
-        logger.info(f"Getting chat stats - Request: {request_id}")
+        logger.info("Getting chat stats - Request: %s", ctx.request_id)
         
-        stats = await chat_manager.get_stats()
+        stats = await ctx.chat_manager.get_stats()
         
         return {
             **stats,
-            "request_id": request_id,
+            "request_id": ctx.request_id,
             "timestamp": time.time()
         }
         
     except Exception as e:
-        logger.error(f"Error getting chat stats - Request: {request_id} - Error: {str(e)}")
+        logger.error("Error getting chat stats - Request: %s - Error: %s", ctx.request_id, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Unable to retrieve chat statistics"
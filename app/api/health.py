@@ -6,25 +6,36 @@ FastAPI endpoints for monitoring application health including
 database connectivity, LLM services, and tool availability.
 """
 
+import asyncio
+import functools
 import logging
 import time
-from typing import Dict, Any
+from typing import Dict, Any, List
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
+from sqlalchemy.orm import Session
 
 from ..dependencies import (
     check_database_health,
     check_llm_health,
     check_tools_health,
-    get_app_settings,
-    get_request_id
+    get_database_session,
+    get_llm_factory,
+    get_tool_registry
 )
-from ..config import Settings
+from ..config import get_settings
+from ..llm.llm_factory import LLMFactory
+from ..middleware.request_id import request_id_var
+from ..tools.tool_registry import ToolRegistry
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Settings are cached by get_settings() and fixed after startup
+SETTINGS = get_settings()
 
 
 class HealthStatus(BaseModel):
@@ -32,15 +43,6 @@ class HealthStatus(BaseModel):
     status: str
     message: str
     timestamp: str
-    
-    class Config:
-        schema_extra = {
-            "example": {
-                "status": "healthy",
-                "message": "Service is operational",
-                "timestamp": "2024-01-15T10:30:00Z"
-            }
-        }
 
 
 class DetailedHealthStatus(BaseModel):
@@ -51,54 +53,176 @@ class DetailedHealthStatus(BaseModel):
     version: str
     environment: str
     request_id: str
-    
-    class Config:
-        schema_extra = {
-            "example": {
-                "overall_status": "healthy",
-                "components": {
-                    "database": {
-                        "status": "healthy",
-                        "message": "Database connection successful",
-                        "timestamp": "2024-01-15T10:30:00Z"
-                    },
-                    "llm": {
-                        "status": "healthy", 
-                        "message": "LLM provider (amazon_nova) is available",
-                        "timestamp": "2024-01-15T10:30:00Z"
-                    },
-                    "tools": {
-                        "status": "healthy",
-                        "message": "Tools system operational",
-                        "timestamp": "2024-01-15T10:30:00Z"
-                    }
+
+
+# OpenAPI examples, attached to the route responses rather than the models
+_HEALTH_EXAMPLE = {
+    "application/json": {
+        "example": {
+            "status": "healthy",
+            "message": "Service is operational",
+            "timestamp": "2024-01-15T10:30:00Z"
+        }
+    }
+}
+
+_DETAILED_HEALTH_EXAMPLE = {
+    "application/json": {
+        "example": {
+            "overall_status": "healthy",
+            "components": {
+                "database": {
+                    "status": "healthy",
+                    "message": "Database connection successful",
+                    "timestamp": "2024-01-15T10:30:00Z"
                 },
-                "uptime_seconds": 3600.5,
-                "version": "1.0.0",
-                "environment": "development",
-                "request_id": "req_12345"
-            }
+                "llm": {
+                    "status": "healthy", 
+                    "message": "LLM provider (amazon_nova) is available",
+                    "timestamp": "2024-01-15T10:30:00Z"
+                },
+                "tools": {
+                    "status": "healthy",
+                    "message": "Tools system operational",
+                    "timestamp": "2024-01-15T10:30:00Z"
+                }
+            },
+            "uptime_seconds": 3600.5,
+            "version": "1.0.0",
+            "environment": "development",
+            "request_id": "req_12345"
         }
+    }
+}
 
 
 # Track application start time for uptime calculation
-_start_time = time.time()
+_start_monotonic = time.monotonic()
+
+# Second-precision UTC timestamp, reformatted only when the second changes
+_ts_cache = [0, ""]
+
+
+def _now_iso() -> str:
+    """Get the current UTC time as an ISO 8601 string (second precision)"""
+    t = int(time.time())
+    if t != _ts_cache[0]:
+        _ts_cache[:] = [t, time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(t))]
+    return _ts_cache[1]
+
+
+# Pre-encoded bodies of the static "healthy" responses; only the timestamp is spliced in
+_HEALTH_OK_PREFIX = b'{"status":"healthy","message":"AI Chatbot service is operational","timestamp":"'
+_LIVENESS_PREFIX = b'{"status":"healthy","message":"Service is alive and responding","timestamp":"'
+_STATUS_SUFFIX = b'"}'
+
+
+@functools.lru_cache()
+def _component_llm_factory() -> LLMFactory:
+    """LLM factory kept for the component route so its client is built once"""
+    return LLMFactory(settings=SETTINGS)
+
+
+async def _probe_database() -> Dict[str, Any]:
+    """Probe the database through a session opened just for this check"""
+    sessions = get_database_session()
+    try:
+        return await check_database_health(next(sessions))
+    finally:
+        sessions.close()
+
+
+async def _probe_llm() -> Dict[str, Any]:
+    """Probe the configured LLM provider"""
+    return await check_llm_health(_component_llm_factory())
+
+
+async def _probe_tools() -> Dict[str, Any]:
+    """Probe the tool registry"""
+    return await check_tools_health(get_tool_registry())
+
+
+# Probes served by the per-component health route; each one resolves only
+# the resource it checks
+_COMPONENT_PROBES = {
+    "database": _probe_database,
+    "llm": _probe_llm,
+    "tools": _probe_tools
+}
+
+
+def _status_code(health_status: str) -> int:
+    """Map a health status to 200, or 503 so load balancers stop routing traffic"""
+    if health_status == "healthy":
+        return status.HTTP_200_OK
+    return status.HTTP_503_SERVICE_UNAVAILABLE
+
+
+def _component(health: Dict[str, Any]) -> Dict[str, Any]:
+    """Trim a probe result to the HealthStatus fields"""
+    return {
+        "status": health["status"],
+        "message": health["message"],
+        "timestamp": health["timestamp"]
+    }
+
+
+def _healthy_response(prefix: bytes) -> Response:
+    """
+    Build a "healthy" status response from a pre-encoded body prefix.
+    
+    Args:
+        prefix: JSON body up to the opening quote of the timestamp value
+        
+    Returns:
+        Response: JSON response with the current timestamp
+    """
+    return Response(
+        content=prefix + _now_iso().encode() + _STATUS_SUFFIX,
+        media_type="application/json"
+    )
+
+
+async def _run_probes(*probes) -> List[Dict[str, Any]]:
+    """
+    Await health probes concurrently.
+    
+    Args:
+        probes: (name, probe coroutine) pairs
+        
+    Returns:
+        List[Dict[str, Any]]: Probe results in the given order; a probe that
+        raised is reported as unhealthy
+    """
+    results = await asyncio.gather(
+        *(probe for _, probe in probes),
+        return_exceptions=True
+    )
+    
+    for i, result in enumerate(results):
+        if isinstance(result, Exception):
+            name = probes[i][0]
+            logger.error("%s health probe raised: %s", name, result)
+            results[i] = {
+                "status": "unhealthy",
+                "message": f"{name} health check error: {str(result)}",
+                "timestamp": _now_iso()
+            }
+    
+    return results
 
 
 @router.get(
     "/health",
-    response_model=HealthStatus,
     summary="Basic health check",
     description="Simple health check endpoint for load balancers and basic monitoring",
     status_code=status.HTTP_200_OK,
     responses={
-        200: {"description": "Service is healthy"},
+        200: {"model": HealthStatus, "description": "Service is healthy", "content": _HEALTH_EXAMPLE},
         503: {"description": "Service is unhealthy"}
     }
 )
-async def health_check(
-    request_id: str = Depends(get_request_id)
-) -> HealthStatus:
+async def health_check() -> Response:
     """
     Basic health check endpoint.
     
@@ -106,41 +230,36 @@ async def health_check(
     This endpoint should be fast and lightweight.
     """
     
+    request_id = request_id_var.get()
+    
     try:
-        logger.debug(f"Health check request - Request ID: {request_id}")
+        logger.debug("Health check request - Request ID: %s", request_id)
         
-        return HealthStatus(
-            status="healthy",
-            message="AI Chatbot service is operational",
-            timestamp=time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
-        )
+        return _healthy_response(_HEALTH_OK_PREFIX)
         
     except Exception as e:
-        logger.error(f"Health check failed - Request ID: {request_id} - Error: {str(e)}")
-        return HealthStatus(
-            status="unhealthy",
-            message=f"Health check failed: {str(e)}",
-            timestamp=time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
-        )
+        logger.error("Health check failed - Request ID: %s - Error: %s", request_id, e)
+        return ORJSONResponse({
+            "status": "unhealthy",
+            "message": f"Health check failed: {str(e)}",
+            "timestamp": _now_iso()
+        }, status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
 
 
 @router.get(
     "/health/detailed",
-    response_model=DetailedHealthStatus,
     summary="Detailed health check",
     description="Comprehensive health check with component status breakdown",
     responses={
-        200: {"description": "Detailed health status"},
+        200: {"model": DetailedHealthStatus, "description": "Detailed health status", "content": _DETAILED_HEALTH_EXAMPLE},
         503: {"description": "One or more components are unhealthy"}
     }
 )
 async def detailed_health_check(
-    db_health: Dict[str, Any] = Depends(check_database_health),
-    llm_health: Dict[str, Any] = Depends(check_llm_health),
-    tools_health: Dict[str, Any] = Depends(check_tools_health),
-    settings: Settings = Depends(get_app_settings),
-    request_id: str = Depends(get_request_id)
-) -> DetailedHealthStatus:
+    db: Session = Depends(get_database_session),
+    llm_factory: LLMFactory = Depends(get_llm_factory),
+    tool_registry: ToolRegistry = Depends(get_tool_registry)
+) -> ORJSONResponse:
     """
     Detailed health check endpoint.
     
@@ -150,139 +269,83 @@ async def detailed_health_check(
     - Tools system status
     """
     
+    request_id = request_id_var.get()
+    uptime_seconds = round(time.monotonic() - _start_monotonic, 2)
+    
     try:
-        logger.info(f"Detailed health check request - Request ID: {request_id}")
+        logger.info("Detailed health check request - Request ID: %s", request_id)
         
-        # Convert health check results to HealthStatus models
+        # Probes are independent, so run them side by side instead of one by one
+        db_health, llm_health, tools_health = await _run_probes(
+            ("Database", check_database_health(db)),
+            ("LLM", check_llm_health(llm_factory)),
+            ("Tools", check_tools_health(tool_registry))
+        )
+        
+        # Keep only the HealthStatus fields of each probe result
         components = {
-            "database": HealthStatus(**db_health),
-            "llm": HealthStatus(**llm_health),
-            "tools": HealthStatus(**tools_health)
+            "database": _component(db_health),
+            "llm": _component(llm_health),
+            "tools": _component(tools_health)
         }
         
         # Determine overall status
         unhealthy_components = [
             name for name, health in components.items()
-            if health.status != "healthy"
+            if health["status"] != "healthy"
         ]
         
         overall_status = "unhealthy" if unhealthy_components else "healthy"
         
         if unhealthy_components:
-            logger.warning(f"Unhealthy components detected: {unhealthy_components}")
-        
-        # Calculate uptime
-        uptime_seconds = time.time() - _start_time
+            logger.warning("Unhealthy components detected: %s", unhealthy_components)
         
-        return DetailedHealthStatus(
-            overall_status=overall_status,
-            components=components,
-            uptime_seconds=round(uptime_seconds, 2),
-            version=settings.app_version,
-            environment=settings.environment,
-            request_id=request_id
-        )
+        return ORJSONResponse({
+            "overall_status": overall_status,
+            "components": components,
+            "uptime_seconds": uptime_seconds,
+            "version": SETTINGS.app_version,
+            "environment": SETTINGS.environment,
+            "request_id": request_id
+        }, status_code=_status_code(overall_status))
         
     except Exception as e:
-        logger.error(f"Detailed health check failed - Request ID: {request_id} - Error: {str(e)}")
+        logger.error("Detailed health check failed - Request ID: %s - Error: %s", request_id, e)
         
         # Return unhealthy status with error information
-        error_health = HealthStatus(
-            status="unhealthy",
-            message=f"Health check error: {str(e)}",
-            timestamp=time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
-        )
+        error_health = {
+            "status": "unhealthy",
+            "message": f"Health check error: {str(e)}",
+            "timestamp": _now_iso()
+        }
         
-        return DetailedHealthStatus(
-            overall_status="unhealthy",
-            components={
+        return ORJSONResponse({
+            "overall_status": "unhealthy",
+            "components": {
                 "database": error_health,
                 "llm": error_health,
                 "tools": error_health
             },
-            uptime_seconds=round(time.time() - _start_time, 2),
-            version=getattr(settings, 'app_version', '1.0.0'),
-            environment=getattr(settings, 'environment', 'unknown'),
-            request_id=request_id
-        )
-
-
-@router.get(
-    "/health/database",
-    response_model=HealthStatus,
-    summary="Database health check",
-    description="Check database connectivity and status",
-    responses={
-        200: {"description": "Database is healthy"},
-        503: {"description": "Database is unhealthy"}
-    }
-)
-async def database_health_check(
-    db_health: Dict[str, Any] = Depends(check_database_health),
-    request_id: str = Depends(get_request_id)
-) -> HealthStatus:
-    """Check database health specifically"""
-    
-    logger.info(f"Database health check - Request ID: {request_id}")
-    return HealthStatus(**db_health)
-
-
-@router.get(
-    "/health/llm", 
-    response_model=HealthStatus,
-    summary="LLM service health check",
-    description="Check LLM service availability and configuration",
-    responses={
-        200: {"description": "LLM service is healthy"},
-        503: {"description": "LLM service is unhealthy"}
-    }
-)
-async def llm_health_check(
-    llm_health: Dict[str, Any] = Depends(check_llm_health),
-    request_id: str = Depends(get_request_id)
-) -> HealthStatus:
-    """Check LLM service health specifically"""
-    
-    logger.info(f"LLM health check - Request ID: {request_id}")
-    return HealthStatus(**llm_health)
-
-
-@router.get(
-    "/health/tools",
-    response_model=HealthStatus,
-    summary="Tools system health check", 
-    description="Check tools system availability and registered tools",
-    responses={
-        200: {"description": "Tools system is healthy"},
-        503: {"description": "Tools system is unhealthy"}
-    }
-)
-async def tools_health_check(
-    tools_health: Dict[str, Any] = Depends(check_tools_health),
-    request_id: str = Depends(get_request_id)
-) -> HealthStatus:
-    """Check tools system health specifically"""
-    
-    logger.info(f"Tools health check - Request ID: {request_id}")
-    return HealthStatus(**tools_health)
+            "uptime_seconds": uptime_seconds,
+            "version": SETTINGS.app_version,
+            "environment": SETTINGS.environment,
+            "request_id": request_id
+        }, status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
 
 
 @router.get(
     "/health/readiness",
-    response_model=HealthStatus,
     summary="Readiness probe",
     description="Kubernetes-style readiness probe to check if service is ready to accept traffic",
     responses={
-        200: {"description": "Service is ready"},
+        200: {"model": HealthStatus, "description": "Service is ready", "content": _HEALTH_EXAMPLE},
         503: {"description": "Service is not ready"}
     }
 )
 async def readiness_probe(
-    db_health: Dict[str, Any] = Depends(check_database_health),
-    llm_health: Dict[str, Any] = Depends(check_llm_health),
-    settings: Settings = Depends(get_app_settings),
-    request_id: str = Depends(get_request_id)
-) -> HealthStatus:
+    db: Session = Depends(get_database_session),
+    llm_factory: LLMFactory = Depends(get_llm_factory)
+) -> ORJSONResponse:
     """
     Readiness probe for Kubernetes deployments.
     
@@ -290,58 +353,55 @@ async def readiness_probe(
     the service can accept traffic.
     """
     
-    logger.debug(f"Readiness probe - Request ID: {request_id}")
+    request_id = request_id_var.get()
+    
+    logger.debug("Readiness probe - Request ID: %s", request_id)
     
     try:
         # Check critical components
-        critical_checks = [db_health, llm_health]
-        
-        all_healthy = all(
-            check.get("status") == "healthy" 
-            for check in critical_checks
+        db_health, llm_health = await _run_probes(
+            ("Database", check_database_health(db)),
+            ("LLM", check_llm_health(llm_factory))
         )
         
-        if all_healthy:
-            return HealthStatus(
-                status="healthy",
-                message="Service is ready to accept traffic",
-                timestamp=time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
-            )
+        # Collect unhealthy critical components in a single pass
+        unhealthy_components = [
+            name for name, check in (("database", db_health), ("llm", llm_health))
+            if check.get("status") != "healthy"
+        ]
+        
+        if not unhealthy_components:
+            return ORJSONResponse({
+                "status": "healthy",
+                "message": "Service is ready to accept traffic",
+                "timestamp": _now_iso()
+            })
         else:
-            unhealthy_components = [
-                "database" if db_health.get("status") != "healthy" else None,
-                "llm" if llm_health.get("status") != "healthy" else None
-            ]
-            unhealthy_components = [c for c in unhealthy_components if c]
-            
-            return HealthStatus(
-                status="unhealthy",
-                message=f"Service not ready - unhealthy components: {', '.join(unhealthy_components)}",
-                timestamp=time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
-            )
+            return ORJSONResponse({
+                "status": "unhealthy",
+                "message": f"Service not ready - unhealthy components: {', '.join(unhealthy_components)}",
+                "timestamp": _now_iso()
+            }, status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
             
     except Exception as e:
-        logger.error(f"Readiness probe failed - Request ID: {request_id} - Error: {str(e)}")
-        return HealthStatus(
-            status="unhealthy",
-            message=f"Readiness check failed: {str(e)}",
-            timestamp=time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
-        )
+        logger.error("Readiness probe failed - Request ID: %s - Error: %s", request_id, e)
+        return ORJSONResponse({
+            "status": "unhealthy",
+            "message": f"Readiness check failed: {str(e)}",
+            "timestamp": _now_iso()
+        }, status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
 
 
 @router.get(
     "/health/liveness",
-    response_model=HealthStatus,
     summary="Liveness probe",
     description="Kubernetes-style liveness probe to check if service is alive",
     responses={
-        200: {"description": "Service is alive"},
+        200: {"model": HealthStatus, "description": "Service is alive", "content": _HEALTH_EXAMPLE},
         503: {"description": "Service is not responding"}
     }
 )
-async def liveness_probe(
-    request_id: str = Depends(get_request_id)
-) -> HealthStatus:
+async def liveness_probe() -> Response:
     """
     Liveness probe for Kubernetes deployments.
     
@@ -349,19 +409,48 @@ async def liveness_probe(
     Should not perform heavy operations.
     """
     
-    logger.debug(f"Liveness probe - Request ID: {request_id}")
+    request_id = request_id_var.get()
+    
+    logger.debug("Liveness probe - Request ID: %s", request_id)
     
     try:
-        return HealthStatus(
-            status="healthy",
-            message="Service is alive and responding",
-            timestamp=time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
-        )
+        return _healthy_response(_LIVENESS_PREFIX)
         
     except Exception as e:
-        logger.error(f"Liveness probe failed - Request ID: {request_id} - Error: {str(e)}")
-        return HealthStatus(
-            status="unhealthy",
-            message=f"Liveness check failed: {str(e)}",
-            timestamp=time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
-        )
\ No newline at end of file
+        logger.error("Liveness probe failed - Request ID: %s - Error: %s", request_id, e)
+        return ORJSONResponse({
+            "status": "unhealthy",
+            "message": f"Liveness check failed: {str(e)}",
+            "timestamp": _now_iso()
+        }, status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
+
+
+# Registered last so the fixed /health/* paths above take precedence over
+# the legacy /health/{component} alias
+@router.get(
+    "/health/component/{component}",
+    summary="Component health check",
+    description="Check a single component: database, llm or tools",
+    responses={
+        200: {"model": HealthStatus, "description": "Component is healthy", "content": _HEALTH_EXAMPLE},
+        404: {"description": "Unknown component"},
+        503: {"description": "Component is unhealthy"}
+    }
+)
+@router.get("/health/{component}", include_in_schema=False)
+async def component_health_check(component: str) -> ORJSONResponse:
+    """Check the health of one component (database, llm or tools)"""
+    
+    request_id = request_id_var.get()
+    
+    probe = _COMPONENT_PROBES.get(component)
+    if probe is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Unknown health component: {component}"
+        )
+    
+    logger.info("%s health check - Request ID: %s", component, request_id)
+    
+    health, = await _run_probes((component, probe()))
+    return ORJSONResponse(_component(health), status_code=_status_code(health["status"]))
\ No newline at end of file
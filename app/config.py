@@ -18,6 +18,12 @@ from pydantic_settings import BaseSettings
 
 logger = logging.getLogger(__name__)
 
+# Prefer the libyaml C parser, falling back to the pure-Python one
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 class LLMConfig(BaseModel):
     """LLM provider configuration"""
@@ -36,6 +42,9 @@ class LLMConfig(BaseModel):
     temperature: float = Field(default=0.7, description="Sampling temperature")
     top_p: float = Field(default=0.9, description="Top-p sampling parameter")
     
+    # Conversation context
+    history_window: int = Field(default=10, ge=1, description="Recent messages sent to the LLM as context")
+    
     @validator('provider')
     def validate_provider(cls, v):
         valid_providers = ['amazon_nova', 'gpt_oss']
@@ -58,6 +67,7 @@ class ToolsConfig(BaseModel):
     enabled: bool = Field(default=True, description="Enable tool functionality")
     timeout_seconds: int = Field(default=30, description="Tool execution timeout")
     max_retries: int = Field(default=3, description="Maximum tool execution retries")
+    context_window: int = Field(default=6, ge=1, description="Recent messages passed to tools as context")
     
     # Delivery tracker specific
     delivery_tracker_enabled: bool = Field(default=True, description="Enable delivery tracker tool")
@@ -71,6 +81,13 @@ class DatabaseConfig(BaseModel):
     max_overflow: int = Field(default=20, description="Max overflow connections")
 
 
+class CacheConfig(BaseModel):
+    """Response cache configuration"""
+    enabled: bool = Field(default=False, description="Enable the Redis response cache")
+    url: str = Field(default="redis://localhost:6379/0", description="Redis URL")
+    ttl_seconds: int = Field(default=3600, description="Cached response lifetime in seconds")
+
+
 class LoggingConfig(BaseModel):
     """Logging configuration"""
     level: str = Field(default="INFO", description="Logging level")
@@ -116,6 +133,7 @@ class Settings(BaseSettings):
     tools: ToolsConfig = Field(default_factory=ToolsConfig)
     database: DatabaseConfig = Field(default_factory=DatabaseConfig)
     logging: LoggingConfig = Field(default_factory=LoggingConfig)
+    cache: CacheConfig = Field(default_factory=CacheConfig)
     
     class Config:
         env_file = ".env"
@@ -157,7 +175,7 @@ def load_config_from_yaml(config_path: str = "config.yaml") -> Dict[str, Any]:
     
     try:
         with open(config_file, 'r', encoding='utf-8') as f:
-            config_data = yaml.safe_load(f) or {}
+            config_data = yaml.load(f, Loader=_YamlLoader) or {}
             logger.info(f"Loaded configuration from {config_path}")
             return config_data
             
@@ -202,6 +220,7 @@ def merge_config_data(yaml_data: Dict[str, Any]) -> Dict[str, Any]:
             'max_tokens': llm_config.get('max_tokens', 4096),
             'temperature': llm_config.get('temperature', 0.7),
             'top_p': llm_config.get('top_p', 0.9),
+            'history_window': llm_config.get('history_window', 10),
         }
         
         # Amazon Nova specific
@@ -238,6 +257,10 @@ def merge_config_data(yaml_data: Dict[str, Any]) -> Dict[str, Any]:
     if 'logging' in yaml_data:
         merged['logging'] = yaml_data['logging']
     
+    # Response cache settings
+    if 'cache' in yaml_data:
+        merged['cache'] = yaml_data['cache']
+    
     return merged
 
 
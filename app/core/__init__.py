@@ -8,6 +8,7 @@ Core business logic for the chatbot application including:
 - Tool detection and execution
 - Conversation flow control
 - Guardrails enforcement
+- Response caching
 """
 
 from .chat_manager import ChatManager
@@ -15,11 +16,13 @@ from .session_manager import SessionManager
 from .tool_detector import ToolDetector
 from .guardrails import GuardrailsManager
 from .conversation_flow import ConversationFlowManager
+from .response_cache import ResponseCache
 
 __all__ = [
     "ChatManager",
     "SessionManager", 
     "ToolDetector",
     "GuardrailsManager",
-    "ConversationFlowManager"
+    "ConversationFlowManager",
+    "ResponseCache"
 ]
\ No newline at end of file
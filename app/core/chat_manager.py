@@ -6,10 +6,13 @@ Main orchestrator for chat functionality including LLM interaction,
 tool calling, session management, and guardrails enforcement.
 """
 
+import asyncio
 import logging
 import time
-from typing import Dict, Any, List, Optional
+from typing import AsyncIterator, Dict, Any, List, NamedTuple, Optional
+from contextlib import aclosing
 from datetime import datetime
+from functools import lru_cache
 
 from ..config import Settings
 from ..database.schemas import ChatRequest, ChatResponse, ConversationMessage
@@ -19,11 +22,102 @@ from ..core.session_manager import SessionManager
 from ..core.tool_detector import ToolDetector
 from ..core.guardrails import GuardrailsManager
 from ..core.conversation_flow import ConversationFlowManager
+from ..core.response_cache import ResponseCache
 from ..utils.exceptions import ChatBotException, LLMError, ToolError, ValidationError
-from ..utils.utils import count_tokens
+from ..utils.utils import count_tokens, count_message_tokens
 
 logger = logging.getLogger(__name__)
 
+_BASE_SYSTEM_MESSAGE = """You are an AI assistant that helps users with various tasks. You have access to tools that can help you provide more accurate and helpful responses."""
+
+_TOOLS_ONLY_INSTRUCTION = """ You should only respond to requests related to the available tools and decline general conversation requests politely."""
+
+_SYSTEM_GUIDELINES = """
+Guidelines:
+- Be helpful, accurate, and concise
+- If you need to use a tool but don't have all required parameters, ask for the missing information
+- If a tool execution fails, explain the issue and suggest alternatives
+- Maintain conversation context and refer back to previous exchanges when relevant
+"""
+
+
+@lru_cache(maxsize=8)
+def _render_system_prefix(tool_registry: ToolRegistry, enable_general_chat: bool) -> str:
+    """
+    Render the system message head for a tool registry and chat mode.
+    
+    Tools are registered at startup (initialize_tools) before any request is
+    served, so the prefix is built once per registry rather than per turn.
+    
+    Args:
+        tool_registry: Registry whose tools are listed
+        enable_general_chat: Whether general conversation is allowed
+        
+    Returns:
+        Base message, plus the available tools block when there are tools
+    """
+    
+    base_message = _BASE_SYSTEM_MESSAGE
+    
+    # Add guardrails context
+    if not enable_general_chat:
+        base_message += _TOOLS_ONLY_INSTRUCTION
+    
+    available_tools = tool_registry.list_tools()
+    if not available_tools:
+        return base_message
+    
+    # Add available tools information
+    tools_info = "Available tools:\n" + "".join(
+        f"- {tool_name}: {tool_info.get('description', 'No description')}\n"
+        for tool_name, tool_info in available_tools.items()
+    )
+    return base_message + "\n\n" + tools_info
+
+
+# Stored message role -> LLM role; anything that is not the user is the assistant
+_llm_role = {"user": "user"}.get
+
+# Characters that close a sentence-sized window of a streamed response
+_SENTENCE_ENDS = ('.', '!', '?', '\n')
+
+
+class _PreparedTurn(NamedTuple):
+    """State produced by the pre-generation steps of the pipeline"""
+    conversation_history: List[ConversationMessage]
+    flow_state: Dict[str, Any]
+    tool_response: Optional[Dict[str, Any]]
+    tool_called: bool
+    tool_name: Optional[str]
+
+
+# Strong references to fire-and-forget tasks so they are not garbage collected mid-flight
+_background_tasks = set()
+
+
+def _spawn_background(coro, description: str) -> asyncio.Task:
+    """
+    Run a coroutine off the response path, logging it if it fails.
+    
+    Args:
+        coro: Coroutine to run
+        description: What the task does, for the error log
+        
+    Returns:
+        The scheduled task
+    """
+    
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    
+    def _done(t: asyncio.Task) -> None:
+        _background_tasks.discard(t)
+        if not t.cancelled() and t.exception() is not None:
+            logger.error("Background task failed (%s): %s", description, t.exception())
+    
+    task.add_done_callback(_done)
+    return task
+
 
 class ChatManager:
     """
@@ -42,8 +136,12 @@ class ChatManager:
         session_manager: SessionManager,
         llm_factory: LLMFactory,
         tool_registry: ToolRegistry,
+        tool_detector: ToolDetector,
+        guardrails: GuardrailsManager,
+        conversation_flow: ConversationFlowManager,
         settings: Settings,
-        request_id: str
+        request_id: str,
+        response_cache: Optional[ResponseCache] = None
     ):
         self.session_manager = session_manager
         self.llm_factory = llm_factory
@@ -51,15 +149,16 @@ class ChatManager:
         self.settings = settings
         self.request_id = request_id
         
-        # Initialize components
-        self.tool_detector = ToolDetector(tool_registry, settings)
-        self.guardrails = GuardrailsManager(settings)
-        self.conversation_flow = ConversationFlowManager(settings)
+        # Shared, application-wide components
+        self.tool_detector = tool_detector
+        self.guardrails = guardrails
+        self.conversation_flow = conversation_flow
+        self.response_cache = response_cache
         
         # Get LLM instance
         self.llm = llm_factory.get_llm()
         
-        logger.debug(f"ChatManager initialized - Request: {request_id}")
+        logger.debug("ChatManager initialized - Request: %s", request_id)
     
     async def process_message(self, chat_request: ChatRequest) -> ChatResponse:
         """
@@ -80,51 +179,38 @@ class ChatManager:
         user_message = chat_request.message
         
         try:
-            logger.info(f"Processing message for session {session_id[:16]}... - Request: {self.request_id}")
-            
-            # Step 1: Get or create session and conversation history
-            session = await self.session_manager.get_or_create_session(session_id)
-            conversation_history = await self.session_manager.get_conversation_history(session_id)
-            
-            logger.debug(f"Session loaded - Messages in history: {len(conversation_history)}")
+            logger.info("Processing message for session %s... - Request: %s", session_id[:16], self.request_id)
             
-            # Step 2: Apply guardrails to user message
-            await self.guardrails.validate_user_message(user_message, session_id, conversation_history)
+            # Steps 1-6: Load the session, apply guardrails, run tools
+            turn = await self._prepare_turn(session_id, user_message)
             
-            # Step 3: Save user message to database
-            user_message_record = await self.session_manager.save_user_message(
-                session_id, user_message
-            )
-            
-            # Step 4: Check conversation flow state
-            flow_state = self.conversation_flow.analyze_conversation_state(
-                conversation_history, user_message
-            )
-            
-            logger.debug(f"Conversation flow state: {flow_state}")
-            
-            # Step 5: Detect if tools are needed
-            tool_detection_result = await self.tool_detector.analyze_message(
-                user_message, conversation_history
-            )
-            
-            logger.debug(f"Tool detection result: {tool_detection_result}")
-            
-            # Step 6: Handle tool execution if needed
-            tool_response = None
-            tool_called = False
-            tool_name = None
-            
-            if tool_detection_result.tool_required:
-                tool_response = await self._handle_tool_execution(
-                    tool_detection_result, user_message, session_id, conversation_history
+            # Turns that ran a tool or answer a pending question depend on more
+            # than the conversation text, so only self-contained turns are cached
+            cache_key = None
+            if self.response_cache and not turn.tool_called and not turn.flow_state.get('awaiting_input'):
+                cache_key = self.response_cache.make_key(
+                    self._get_base_system_prefix(), turn.flow_state, turn.conversation_history, user_message
                 )
-                tool_called = True
-                tool_name = tool_detection_result.tool_name
+                cached = await self.response_cache.get(cache_key)
+                if cached:
+                    logger.info("Response cache hit - Session: %s...", session_id[:16])
+                    
+                    # No LLM tokens were spent on a cached answer
+                    await self._persist_ai_response(turn, session_id, cached['response'], 0, 0)
+                    
+                    return ChatResponse(
+                        response=cached['response'],
+                        input_tokens=0,
+                        output_tokens=0,
+                        tool_called=False,
+                        tool_name=None,
+                        session_id=session_id,
+                        processing_time=time.time() - start_time
+                    )
             
             # Step 7: Generate LLM response
             ai_response, input_tokens, output_tokens = await self._generate_llm_response(
-                user_message, conversation_history, tool_response, flow_state
+                user_message, turn.conversation_history, turn.tool_response, turn.flow_state
             )
             
             # Step 8: Apply guardrails to AI response
@@ -132,49 +218,263 @@ class ChatManager:
                 ai_response, user_message, session_id
             )
             
-            # Step 9: Save AI response to database
-            await self.session_manager.save_ai_message(
-                session_id, ai_response, input_tokens, output_tokens, tool_name
-            )
+            if cache_key:
+                _spawn_background(
+                    self.response_cache.set(cache_key, {'response': ai_response}),
+                    f"cache response for session {session_id[:16]}..."
+                )
             
-            # Step 10: Update session activity
-            await self.session_manager.update_session_activity(session_id)
+            # Step 9: Save AI response to database; the same commit also bumps
+            # the session totals and last activity
+            await self._persist_ai_response(
+                turn, session_id, ai_response, input_tokens, output_tokens
+            )
             
             # Calculate processing time
             processing_time = time.time() - start_time
             
             logger.info(
-                f"Message processed successfully - Session: {session_id[:16]}... "
-                f"Processing time: {processing_time:.2f}s, Tool called: {tool_called}"
+                "Message processed successfully - Session: %s... "
+                "Processing time: %.2fs, Tool called: %s",
+                session_id[:16], processing_time, turn.tool_called
             )
             
             return ChatResponse(
                 response=ai_response,
                 input_tokens=input_tokens,
                 output_tokens=output_tokens,
-                tool_called=tool_called,
-                tool_name=tool_name,
+                tool_called=turn.tool_called,
+                tool_name=turn.tool_name,
                 session_id=session_id,
                 processing_time=processing_time
             )
             
         except Exception as e:
-            logger.error(
-                f"Error processing message - Session: {session_id[:16]}... "
-                f"Request: {self.request_id} - Error: {str(e)}",
-                exc_info=True
+            raise await self._processing_error(session_id, e)
+    
+    async def process_message_stream(self, chat_request: ChatRequest) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Process a chat message, streaming the AI response as it is generated.
+        
+        Runs the same pipeline as process_message, but yields the response in
+        sentence-sized chunks, each checked by the output guardrails, and
+        persists the complete text once generation finishes.
+        
+        Args:
+            chat_request: User chat request
+            
+        Yields:
+            {'type': 'token', 'content': ...} chunks, then one {'type': 'done', ...}
+            chunk carrying token counts and tool metadata
+            
+        Raises:
+            ChatBotException: If processing fails
+        """
+        
+        start_time = time.time()
+        session_id = chat_request.session_id
+        user_message = chat_request.message
+        
+        try:
+            logger.info("Streaming message for session %s... - Request: %s", session_id[:16], self.request_id)
+            
+            # Steps 1-6: Load the session, apply guardrails, run tools
+            turn = await self._prepare_turn(session_id, user_message)
+            
+            # Step 7: Stream the LLM response
+            messages = self._prepare_conversation_context(
+                user_message, turn.conversation_history, turn.tool_response, turn.flow_state
             )
+            input_tokens = self._count_input_tokens(messages)
             
-            # Log error to session if possible
-            try:
-                await self.session_manager.log_error(session_id, str(e), self.request_id)
-            except:
-                pass
+            # Step 8: Apply guardrails to each completed sentence as it arrives
+            parts: List[str] = []
+            emitted = 0
+            pending = ""
             
-            if isinstance(e, ChatBotException):
-                raise
-            else:
-                raise ChatBotException(f"Failed to process message: {str(e)}")
+            # aclosing() stops the provider stream promptly if the client goes away
+            stream = self.llm.generate_response_stream(
+                messages,
+                max_tokens=self.settings.llm.max_tokens,
+                temperature=self.settings.llm.temperature,
+                top_p=self.settings.llm.top_p
+            )
+            async with aclosing(stream):
+                async for fragment in stream:
+                    pending += fragment
+                    boundary = max(pending.rfind(mark) for mark in _SENTENCE_ENDS)
+                    if boundary < 0:
+                        continue
+                    
+                    window, pending = pending[:boundary + 1], pending[boundary + 1:]
+                    window = self.guardrails.validate_ai_response_chunk(window, session_id, emitted)
+                    if window:
+                        parts.append(window)
+                        emitted += len(window)
+                        yield {'type': 'token', 'content': window}
+            
+            if pending:
+                window = self.guardrails.validate_ai_response_chunk(pending, session_id, emitted)
+                if window:
+                    parts.append(window)
+                    yield {'type': 'token', 'content': window}
+            
+            ai_response = "".join(parts)
+            output_tokens = count_tokens(ai_response)
+            
+            # Step 9: Save the complete AI response
+            await self._persist_ai_response(
+                turn, session_id, ai_response, input_tokens, output_tokens
+            )
+            
+            processing_time = time.time() - start_time
+            
+            logger.info(
+                "Message streamed successfully - Session: %s... "
+                "Processing time: %.2fs, Tool called: %s",
+                session_id[:16], processing_time, turn.tool_called
+            )
+            
+            yield {
+                'type': 'done',
+                'input_tokens': input_tokens,
+                'output_tokens': output_tokens,
+                'tool_called': turn.tool_called,
+                'tool_name': turn.tool_name,
+                'session_id': session_id,
+                'processing_time': processing_time
+            }
+            
+        except Exception as e:
+            raise await self._processing_error(session_id, e)
+    
+    async def _prepare_turn(self, session_id: str, user_message: str) -> _PreparedTurn:
+        """
+        Run the steps that precede LLM generation.
+        
+        Args:
+            session_id: Session identifier
+            user_message: User's message
+            
+        Returns:
+            _PreparedTurn with the loaded history, flow state and tool result
+            
+        Raises:
+            ValidationError: If the message violates guardrails
+        """
+        
+        # Step 1: Get or create session and conversation history
+        session = await self.session_manager.get_or_create_session(session_id)
+        # Only the recent window is loaded; guardrails get the session-wide
+        # count and start time from a separate aggregate query
+        conversation_history = await self.session_manager.get_conversation_history(
+            session_id, limit=self.settings.llm.history_window
+        )
+        message_count, session_start = await self.session_manager.get_history_bounds(session_id)
+        
+        logger.debug("Session loaded - Messages in history: %d", message_count)
+        
+        # Step 2: Apply guardrails to user message; nothing else runs for a
+        # rejected message
+        await self.guardrails.validate_user_message(
+            user_message, session_id, conversation_history,
+            message_count=message_count, session_start=session_start
+        )
+        
+        # Step 3: Save user message to database
+        await self.session_manager.save_user_message(session_id, user_message)
+        
+        # Step 4: Check conversation flow state
+        flow_state = self.conversation_flow.analyze_conversation_state(
+            conversation_history, user_message
+        )
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Conversation flow state: %s", flow_state)
+        
+        # Step 5: Detect if tools are needed
+        tool_detection_result = await self.tool_detector.analyze_message(
+            user_message, conversation_history
+        )
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Tool detection result: %s", tool_detection_result)
+        
+        # Step 6: Handle tool execution if needed
+        tool_response = None
+        tool_called = False
+        tool_name = None
+        
+        if tool_detection_result.tool_required:
+            tool_response = await self._handle_tool_execution(
+                tool_detection_result, user_message, session_id, conversation_history
+            )
+            tool_called = True
+            tool_name = tool_detection_result.tool_name
+        
+        return _PreparedTurn(
+            conversation_history=conversation_history,
+            flow_state=flow_state,
+            tool_response=tool_response,
+            tool_called=tool_called,
+            tool_name=tool_name
+        )
+    
+    async def _persist_ai_response(
+        self,
+        turn: _PreparedTurn,
+        session_id: str,
+        ai_response: str,
+        input_tokens: int,
+        output_tokens: int
+    ) -> None:
+        """
+        Save the AI response.
+        
+        Awaited inline: the save goes through the request-scoped database
+        session, which is closed when the request finishes, and a failed save
+        must reach the caller rather than only the log.
+        
+        Args:
+            turn: Prepared turn (for the tool used)
+            session_id: Session identifier
+            ai_response: Final AI response text
+            input_tokens: Number of input tokens used
+            output_tokens: Number of output tokens generated
+        """
+        
+        await self.session_manager.save_ai_message(
+            session_id, ai_response, input_tokens, output_tokens, turn.tool_name
+        )
+    
+    async def _processing_error(self, session_id: str, e: Exception) -> ChatBotException:
+        """
+        Log a pipeline failure and convert it to the exception to raise.
+        
+        Args:
+            session_id: Session identifier
+            e: Exception raised while processing
+            
+        Returns:
+            ChatBotException to raise to the caller
+        """
+        
+        logger.error(
+            f"Error processing message - Session: {session_id[:16]}... "
+            f"Request: {self.request_id} - Error: {str(e)}",
+            exc_info=True
+        )
+        
+        # Log error to session if possible
+        try:
+            await self.session_manager.log_error(session_id, str(e), self.request_id)
+        except Exception as log_exc:
+            logger.warning("Failed to log error to session: %s", log_exc)
+        
+        if isinstance(e, ChatBotException):
+            return e
+        else:
+            return ChatBotException(f"Failed to process message: {str(e)}")
     
     async def _handle_tool_execution(
         self,
@@ -200,7 +500,7 @@ class ChatManager:
             tool_name = detection_result.tool_name
             required_params = detection_result.required_parameters
             
-            logger.info(f"Executing tool: {tool_name} - Session: {session_id[:16]}...")
+            logger.info("Executing tool: %s - Session: %s...", tool_name, session_id[:16])
             
             # Check if all required parameters are available
             missing_params = [
@@ -209,7 +509,7 @@ class ChatManager:
             ]
             
             if missing_params:
-                logger.debug(f"Missing parameters for tool {tool_name}: {missing_params}")
+                logger.debug("Missing parameters for tool %s: %s", tool_name, missing_params)
                 # Tool will be called but may prompt for missing parameters
                 # The LLM will handle requesting missing information
             
@@ -218,17 +518,21 @@ class ChatManager:
             if not tool:
                 raise ToolError(f"Tool {tool_name} not found")
             
+            # Tools see a bounded window of the conversation; a tool can ask for
+            # a different size with a context_history_window attribute
+            context_window = getattr(tool, 'context_history_window', None) or self.settings.tools.context_window
+            
             # Execute tool
             tool_result = await tool.execute(
                 parameters=detection_result.extracted_parameters,
                 conversation_context={
                     'session_id': session_id,
                     'user_message': user_message,
-                    'conversation_history': conversation_history
+                    'conversation_history': conversation_history[-context_window:]
                 }
             )
             
-            logger.info(f"Tool {tool_name} executed successfully - Session: {session_id[:16]}...")
+            logger.info("Tool %s executed successfully - Session: %s...", tool_name, session_id[:16])
             
             return {
                 'tool_name': tool_name,
@@ -268,16 +572,14 @@ class ChatManager:
         """
         
         try:
-            logger.debug(f"Generating LLM response - Request: {self.request_id}")
+            logger.debug("Generating LLM response - Request: %s", self.request_id)
             
             # Prepare conversation context
             messages = self._prepare_conversation_context(
                 user_message, conversation_history, tool_response, flow_state
             )
             
-            # Count input tokens
-            input_text = self._format_messages_for_token_counting(messages)
-            input_tokens = count_tokens(input_text)
+            input_tokens = self._count_input_tokens(messages)
             
             # Generate response using LLM
             ai_response = await self.llm.generate_response(
@@ -291,8 +593,8 @@ class ChatManager:
             output_tokens = count_tokens(ai_response)
             
             logger.debug(
-                f"LLM response generated - Input tokens: {input_tokens}, "
-                f"Output tokens: {output_tokens}"
+                "LLM response generated - Input tokens: %d, Output tokens: %d",
+                input_tokens, output_tokens
             )
             
             return ai_response, input_tokens, output_tokens
@@ -301,6 +603,24 @@ class ChatManager:
             logger.error(f"LLM response generation failed - Error: {str(e)}")
             raise LLMError(f"Failed to generate response: {str(e)}")
     
+    @staticmethod
+    def _count_input_tokens(messages: List[Dict[str, str]]) -> int:
+        """
+        Count input tokens for a prepared message list.
+        
+        Counts are cached per message, so unchanged history is not re-encoded
+        every turn; one newline separator is added between messages.
+        
+        Args:
+            messages: Messages that will be sent to the LLM
+            
+        Returns:
+            Input token count
+        """
+        return sum(
+            count_message_tokens(msg['role'], msg['content']) for msg in messages
+        ) + len(messages) - 1
+    
     def _prepare_conversation_context(
         self,
         user_message: str,
@@ -321,19 +641,19 @@ class ChatManager:
             List of message dictionaries for LLM
         """
         
-        messages = []
+        history = conversation_history[-self.settings.llm.history_window:]  # Limit history to prevent context overflow
+        messages: List[Dict[str, str]] = [None] * (len(history) + 2)
         
         # System message with context
         system_message = self._build_system_message(tool_response, flow_state)
-        messages.append({"role": "system", "content": system_message})
+        messages[0] = {"role": "system", "content": system_message}
         
         # Add conversation history
-        for msg in conversation_history[-10:]:  # Limit history to prevent context overflow
-            role = "user" if msg.role == "user" else "assistant"
-            messages.append({"role": role, "content": msg.content})
+        for i, msg in enumerate(history, 1):
+            messages[i] = {"role": _llm_role(msg.role, "assistant"), "content": msg.content}
         
         # Add current user message
-        messages.append({"role": "user", "content": user_message})
+        messages[-1] = {"role": "user", "content": user_message}
         
         return messages
     
@@ -353,24 +673,7 @@ class ChatManager:
             System message string
         """
         
-        system_parts = []
-        
-        # Base system message
-        base_message = """You are an AI assistant that helps users with various tasks. You have access to tools that can help you provide more accurate and helpful responses."""
-        
-        # Add guardrails context
-        if not self.settings.guardrails.enable_general_chat:
-            base_message += """ You should only respond to requests related to the available tools and decline general conversation requests politely."""
-        
-        system_parts.append(base_message)
-        
-        # Add available tools information
-        available_tools = self.tool_registry.list_tools()
-        if available_tools:
-            tools_info = "Available tools:\n"
-            for tool_name, tool_info in available_tools.items():
-                tools_info += f"- {tool_name}: {tool_info.get('description', 'No description')}\n"
-            system_parts.append(tools_info)
+        system_parts = [self._get_base_system_prefix()]
         
         # Add tool response context if available
         if tool_response:
@@ -385,34 +688,19 @@ class ChatManager:
             if flow_state.get('awaiting_input'):
                 system_parts.append(f"You are currently waiting for user input: {flow_state.get('waiting_for', 'additional information')}")
         
-        # Guidelines
-        guidelines = """
-Guidelines:
-- Be helpful, accurate, and concise
-- If you need to use a tool but don't have all required parameters, ask for the missing information
-- If a tool execution fails, explain the issue and suggest alternatives
-- Maintain conversation context and refer back to previous exchanges when relevant
-"""
-        system_parts.append(guidelines)
+        system_parts.append(_SYSTEM_GUIDELINES)
         
         return "\n\n".join(system_parts)
     
-    def _format_messages_for_token_counting(self, messages: List[Dict[str, str]]) -> str:
+    def _get_base_system_prefix(self) -> str:
         """
-        Format messages for token counting.
+        Get the static head of the system message (base instructions and tools).
         
-        Args:
-            messages: List of conversation messages
-            
         Returns:
-            Formatted string for token counting
+            Cached system message prefix
         """
         
-        formatted_parts = []
-        for msg in messages:
-            formatted_parts.append(f"{msg['role']}: {msg['content']}")
-        
-        return "\n".join(formatted_parts)
+        return _render_system_prefix(self.tool_registry, self.settings.guardrails.enable_general_chat)
     
     async def get_session_info(self, session_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -459,14 +747,14 @@ Guidelines:
         """
         
         try:
-            logger.info(f"Clearing session: {session_id[:16]}... - Request: {self.request_id}")
+            logger.info("Clearing session: %s... - Request: %s", session_id[:16], self.request_id)
             
             success = await self.session_manager.clear_session(session_id)
             
             if success:
-                logger.info(f"Session cleared successfully: {session_id[:16]}...")
+                logger.info("Session cleared successfully: %s...", session_id[:16])
             else:
-                logger.warning(f"Failed to clear session: {session_id[:16]}...")
+                logger.warning("Failed to clear session: %s...", session_id[:16])
             
             return success
             
@@ -487,23 +775,21 @@ Guidelines:
         """
         
         try:
-            logger.debug(f"Listing sessions - Limit: {limit}, Offset: {offset} - Request: {self.request_id}")
-            
-            sessions = await self.session_manager.list_sessions(limit=limit, offset=offset)
-            
-            session_list = []
-            for session in sessions:
-                message_count = await self.session_manager.get_message_count(session.session_id)
-                
-                session_list.append({
-                    "session_id": session.session_id,
-                    "created_at": session.created_at.isoformat() if session.created_at else None,
-                    "last_activity": session.last_activity.isoformat() if session.last_activity else None,
-                    "total_messages": message_count,
-                    "is_active": session.is_active
-                })
+            logger.debug("Listing sessions - Limit: %d, Offset: %d - Request: %s", limit, offset, self.request_id)
             
-            return session_list
+            # Plain column rows, with message counts for this page only
+            rows = await self.session_manager.list_session_summaries(limit=limit, offset=offset)
+            
+            return [
+                {
+                    "session_id": session_id,
+                    "created_at": created_at.isoformat() if created_at else None,
+                    "last_activity": last_activity.isoformat() if last_activity else None,
+                    "total_messages": message_count,
+                    "is_active": is_active
+                }
+                for session_id, created_at, last_activity, is_active, message_count in rows
+            ]
             
         except Exception as e:
             logger.error(f"Error listing sessions - Error: {str(e)}")
@@ -518,7 +804,7 @@ Guidelines:
         """
         
         try:
-            logger.debug(f"Getting chat stats - Request: {self.request_id}")
+            logger.debug("Getting chat stats - Request: %s", self.request_id)
             
             stats = await self.session_manager.get_statistics()
             
@@ -8,7 +8,8 @@ for maintaining coherent multi-turn conversations.
 
 import logging
 import re
-from typing import Dict, Any, List, Optional, Set
+from functools import lru_cache
+from typing import Dict, Any, FrozenSet, List, Optional, Set
 from datetime import datetime, timedelta
 from enum import Enum
 
@@ -16,6 +17,11 @@ from ..config import Settings
 from ..database.schemas import ConversationMessage
 from ..utils.exceptions import ValidationError
 
+try:
+    import hyperscan
+except ImportError:  # optional speedup: the re fallback gives the same classifications
+    hyperscan = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -38,6 +44,191 @@ class InputType(Enum):
     GENERAL = "general"
 
 
+
+# Phrases that show what the AI is waiting for (sources are kept for flow state)
+_WAITING_PATTERN_SOURCES = {
+    InputType.DELIVERY_NUMBER: [
+        r'delivery\s*number',
+        r'tracking\s*number',
+        r'package\s*id',
+        r'shipment\s*id',
+        r'order\s*number'
+    ],
+    InputType.CONFIRMATION: [
+        r'confirm',
+        r'yes\s*or\s*no',
+        r'proceed',
+        r'continue'
+    ],
+    InputType.CLARIFICATION: [
+        r'clarify',
+        r'specify',
+        r'more\s*details',
+        r'which\s*one'
+    ],
+    InputType.CHOICE: [
+        r'choose',
+        r'select',
+        r'option',
+        r'preference'
+    ]
+}
+
+# All patterns are compiled once at import and shared by every instance. Each
+# group is folded into a single alternation so the text is scanned once per
+# group rather than once per pattern; waiting phrases get one alternation per
+# input type, keeping the type priority of the order above
+_WAITING_PATTERNS = {
+    input_type: re.compile('|'.join(patterns))
+    for input_type, patterns in _WAITING_PATTERN_SOURCES.items()
+}
+
+# Flat (pattern, input_type) pairs in priority order for the re fallback scan
+_WAITING_PATTERN_ORDER = tuple(
+    (pattern, input_type) for input_type, pattern in _WAITING_PATTERNS.items()
+)
+
+# The same alternations keyed by InputType value, as stored in flow state
+_WAITING_PATTERNS_BY_VALUE = {
+    input_type.value: pattern for input_type, pattern in _WAITING_PATTERNS.items()
+}
+
+
+# Distinct AI messages whose analysis is kept (per process)
+_AI_ANALYSIS_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=_AI_ANALYSIS_CACHE_SIZE)
+def _repeats_request(input_type: str, ai_message: str) -> bool:
+    """Whether an AI message asks for the given input type (by InputType value)"""
+    pattern = _WAITING_PATTERNS_BY_VALUE.get(input_type, _QUESTION_PATTERN)
+    return pattern.search(ai_message.lower()) is not None
+
+
+def _build_waiting_scanner():
+    """
+    Compile every waiting-for alternation into one Hyperscan database.
+    
+    Returns:
+        Tuple of (database, input types indexed by pattern id), or None when
+        hyperscan is not installed or the patterns fail to compile
+    """
+    
+    if hyperscan is None:
+        return None
+    
+    input_types = list(_WAITING_PATTERN_SOURCES)
+    try:
+        database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+        database.compile(
+            expressions=['|'.join(_WAITING_PATTERN_SOURCES[t]).encode() for t in input_types],
+            ids=list(range(len(input_types))),
+            elements=len(input_types),
+            flags=[hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP] * len(input_types)
+        )
+    except Exception as e:
+        logger.warning(f"Hyperscan compile failed, using re for waiting-for detection: {str(e)}")
+        return None
+    
+    return database, input_types
+
+
+# Optional single-pass DFA over all waiting-for patterns; ids follow type priority
+_WAITING_SCANNER = _build_waiting_scanner()
+
+_QUESTION_PATTERN = re.compile(r'\?')
+
+# Single-word replies are checked as set membership against the message's words
+_WORD_PATTERN = re.compile(r'\w+')
+
+_POSITIVE_RESPONSES = frozenset({
+    'yes', 'yep', 'yeah', 'sure', 'ok', 'okay', 'confirm', 'proceed',
+    'correct', 'right', 'agree'
+})
+
+_NEGATIVE_RESPONSES = frozenset({
+    'no', 'nope', 'cancel', 'stop', 'wrong', 'incorrect', 'disagree'
+})
+
+# Any whole word in one of the delivery number formats, found in one scan
+_DELIVERY_NUMBER_PATTERN = re.compile(
+    r'\b(?:[A-Z]{2}\d{8,12}'  # Standard tracking format
+    r'|\d{10,15}'              # Numeric tracking
+    r'|[A-Z0-9]{8,20})\b'      # Alphanumeric tracking
+)
+
+# Formats ranked first when several numbers are found, most specific first
+_DELIVERY_NUMBER_RANKS = (
+    re.compile(r'[A-Z]{2}\d{8,12}'),
+    re.compile(r'\d{10,15}')
+)
+
+_COMPLETION_WORDS = frozenset({'thanks', 'goodbye', 'bye', 'done', 'finished'})
+
+# Multi-word completion phrases still need a regex
+_COMPLETION_PHRASES = re.compile(
+    r'\b(?:thank\s*you|no\s*more\s*questions|that\'s\s*all)\b'
+)
+
+# Every completion phrase contains one of these literals; without any of
+# them the phrase regex cannot match and is skipped
+_COMPLETION_PHRASE_KEYWORDS = ('thank', 'questions', "that's")
+
+_INPUT_DESCRIPTIONS = {
+    InputType.DELIVERY_NUMBER: "delivery or tracking number",
+    InputType.CONFIRMATION: "confirmation (yes/no)",
+    InputType.CLARIFICATION: "clarification or additional details",
+    InputType.CHOICE: "selection from available options",
+    InputType.GENERAL: "general information"
+}
+
+# Shared read-only lists; kept as lists since flow state is rendered into the prompt
+_INPUT_ALTERNATIVES = {
+    InputType.DELIVERY_NUMBER: [
+        "tracking number",
+        "package ID",
+        "shipment number",
+        "order number"
+    ],
+    InputType.CONFIRMATION: [
+        "yes",
+        "no",
+        "confirm",
+        "cancel"
+    ],
+    InputType.CLARIFICATION: [
+        "provide more details",
+        "specify what you mean",
+        "explain further"
+    ],
+    InputType.CHOICE: [
+        "select option number",
+        "choose by letter",
+        "say 'first', 'second', etc."
+    ]
+}
+
+_URGENT_INDICATORS = re.compile(
+    r'please\s*provide|need\s*to\s*know|required|must\s*have|important'
+)
+
+# Numbered, lettered and ordinal choices, found in a single scan
+_CHOICE_PATTERN = re.compile(
+    r'\b(?:(?P<number>[1-9])|(?P<letter>[a-e])|(?P<ordinal>first|second|third|fourth|fifth))\b'
+)
+
+_ORDINAL_CHOICES = {
+    'first': 'option_1',
+    'second': 'option_2',
+    'third': 'option_3',
+    'fourth': 'option_4',
+    'fifth': 'option_5'
+}
+
+# Lower rank wins when several ordinals appear
+_ORDINAL_RANKS = {ordinal: rank for rank, ordinal in enumerate(_ORDINAL_CHOICES)}
+
+
 class ConversationFlowManager:
     """
     Manages conversation flow and state tracking.
@@ -54,52 +245,27 @@ class ConversationFlowManager:
         self.settings = settings
         
         # Patterns for detecting different types of responses
-        self.waiting_patterns = {
-            InputType.DELIVERY_NUMBER: [
-                r'delivery\s*number',
-                r'tracking\s*number',
-                r'package\s*id',
-                r'shipment\s*id',
-                r'order\s*number'
-            ],
-            InputType.CONFIRMATION: [
-                r'confirm',
-                r'yes\s*or\s*no',
-                r'proceed',
-                r'continue'
-            ],
-            InputType.CLARIFICATION: [
-                r'clarify',
-                r'specify',
-                r'more\s*details',
-                r'which\s*one'
-            ],
-            InputType.CHOICE: [
-                r'choose',
-                r'select',
-                r'option',
-                r'preference'
-            ]
-        }
+        self.waiting_patterns = _WAITING_PATTERNS
         
         # Positive/negative response patterns
-        self.positive_responses = [
-            r'\byes\b', r'\byep\b', r'\byeah\b', r'\bsure\b', 
-            r'\bok\b', r'\bokay\b', r'\bconfirm\b', r'\bproceed\b',
-            r'\bcorrect\b', r'\bright\b', r'\bagree\b'
-        ]
-        
-        self.negative_responses = [
-            r'\bno\b', r'\bnope\b', r'\bcancel\b', r'\bstop\b',
-            r'\bwrong\b', r'\bincorrect\b', r'\bdisagree\b'
-        ]
-        
-        # Delivery number patterns
-        self.delivery_number_patterns = [
-            r'\b[A-Z]{2}\d{8,12}\b',  # Standard tracking format
-            r'\b\d{10,15}\b',         # Numeric tracking
-            r'\b[A-Z0-9]{8,20}\b'     # Alphanumeric tracking
-        ]
+        self.positive_responses = _POSITIVE_RESPONSES
+        self.negative_responses = _NEGATIVE_RESPONSES
+        
+        # Delivery number pattern
+        self.delivery_number_pattern = _DELIVERY_NUMBER_PATTERN
+        
+        # Reply matchers keyed by the InputType value stored in waiting_for['type']
+        self._response_handlers = {
+            InputType.DELIVERY_NUMBER.value: self._match_delivery_number,
+            InputType.CONFIRMATION.value: self._match_confirmation,
+            InputType.CLARIFICATION.value: self._match_clarification,
+            InputType.CHOICE.value: self._match_choice,
+            InputType.GENERAL.value: self._match_general
+        }
+        
+        # Analyses keyed by AI message text, shared across sessions; a message
+        # is re-analyzed every user turn until the AI replies again
+        self._classify_ai_request_cached = lru_cache(maxsize=_AI_ANALYSIS_CACHE_SIZE)(self._classify_ai_request)
         
         logger.debug("ConversationFlowManager initialized")
     
@@ -123,6 +289,10 @@ class ConversationFlowManager:
             if not conversation_history:
                 return self._create_flow_state(ConversationState.INITIAL)
             
+            # Lowercase and split the user message once for every check below
+            message_lower = current_message.lower()
+            message_words = frozenset(self._tokenize(message_lower))
+            
             # Get last AI message to understand context
             last_ai_message = self._get_last_ai_message(conversation_history)
             
@@ -134,7 +304,9 @@ class ConversationFlowManager:
             
             if waiting_for:
                 # Check if user provided the requested information
-                provided_info = self._analyze_user_response(current_message, waiting_for)
+                provided_info = self._analyze_user_response(
+                    current_message, waiting_for, message_lower, message_words
+                )
                 
                 if provided_info['has_requested_info']:
                     return self._create_flow_state(
@@ -150,7 +322,7 @@ class ConversationFlowManager:
                     )
             
             # Check if conversation should be completed
-            if self._should_complete_conversation(conversation_history, current_message):
+            if self._should_complete_conversation(conversation_history, message_lower, message_words):
                 return self._create_flow_state(ConversationState.COMPLETED)
             
             return self._create_flow_state(ConversationState.ONGOING)
@@ -182,7 +354,8 @@ class ConversationFlowManager:
             **kwargs
         }
         
-        logger.debug(f"Created flow state: {flow_state}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Created flow state: %s", flow_state)
         return flow_state
     
     def _get_last_ai_message(self, conversation_history: List[ConversationMessage]) -> Optional[ConversationMessage]:
@@ -196,10 +369,7 @@ class ConversationFlowManager:
             Last AI message or None
         """
         
-        for message in reversed(conversation_history):
-            if message.role == 'assistant':
-                return message
-        return None
+        return next((message for message in reversed(conversation_history) if message.role == 'assistant'), None)
     
     def _analyze_ai_request(self, ai_message: str) -> Optional[Dict[str, Any]]:
         """
@@ -212,18 +382,31 @@ class ConversationFlowManager:
             Information about what the AI is requesting or None
         """
         
+        analysis = self._classify_ai_request_cached(ai_message)
+        return dict(analysis) if analysis else None
+    
+    def _classify_ai_request(self, ai_message: str) -> Optional[Dict[str, Any]]:
+        """
+        Match an AI message against the waiting-for-input patterns.
+        
+        Args:
+            ai_message: AI assistant's message
+            
+        Returns:
+            Information about what the AI is requesting or None
+        """
+        
         ai_message_lower = ai_message.lower()
         
-        for input_type, patterns in self.waiting_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, ai_message_lower):
-                    return {
-                        'type': input_type.value,
-                        'description': self._get_input_description(input_type),
-                        'patterns': patterns,
-                        'urgent': self._is_urgent_request(ai_message_lower),
-                        'alternatives': self._get_input_alternatives(input_type)
-                    }
+        input_type = self._detect_waiting_type(ai_message_lower)
+        if input_type is not None:
+            return {
+                'type': input_type.value,
+                'description': self._get_input_description(input_type),
+                'patterns': _WAITING_PATTERN_SOURCES[input_type],
+                'urgent': self._is_urgent_request(ai_message_lower),
+                'alternatives': self._get_input_alternatives(input_type)
+            }
         
         # Check for question marks indicating a question
         if '?' in ai_message:
@@ -237,21 +420,52 @@ class ConversationFlowManager:
         
         return None
     
-    def _analyze_user_response(self, user_message: str, waiting_for: Dict[str, Any]) -> Dict[str, Any]:
+    def _detect_waiting_type(self, ai_message_lower: str) -> Optional[InputType]:
+        """
+        Find the highest-priority input type whose patterns match.
+        
+        Args:
+            ai_message_lower: Lowercased AI message
+            
+        Returns:
+            Matching input type or None
+        """
+        
+        if _WAITING_SCANNER is None:
+            for pattern, input_type in _WAITING_PATTERN_ORDER:
+                if pattern.search(ai_message_lower):
+                    return input_type
+            return None
+        
+        # One scan reports every matching type; the lowest id has priority
+        database, input_types = _WAITING_SCANNER
+        matched = []
+        database.scan(
+            ai_message_lower.encode(),
+            match_event_handler=lambda pattern_id, start, end, flags, context: matched.append(pattern_id)
+        )
+        return input_types[min(matched)] if matched else None
+    
+    def _analyze_user_response(
+        self, 
+        user_message: str, 
+        waiting_for: Dict[str, Any],
+        user_message_lower: str,
+        user_words: FrozenSet[str]
+    ) -> Dict[str, Any]:
         """
         Analyze user response to see if it contains requested information.
         
         Args:
             user_message: User's message
             waiting_for: Information about what was requested
+            user_message_lower: Lowercased user message
+            user_words: Words of the lowercased user message
             
         Returns:
             Analysis of user response
         """
         
-        input_type = InputType(waiting_for['type'])
-        user_message_lower = user_message.lower()
-        
         result = {
             'has_requested_info': False,
             'extracted_info': None,
@@ -259,66 +473,87 @@ class ConversationFlowManager:
             'response_type': None
         }
         
-        if input_type == InputType.DELIVERY_NUMBER:
-            delivery_numbers = self._extract_delivery_numbers(user_message)
-            if delivery_numbers:
-                result.update({
-                    'has_requested_info': True,
-                    'extracted_info': delivery_numbers[0],  # Take first found
-                    'confidence': 0.9,
-                    'response_type': 'delivery_number'
-                })
-        
-        elif input_type == InputType.CONFIRMATION:
-            if self._is_positive_response(user_message_lower):
-                result.update({
-                    'has_requested_info': True,
-                    'extracted_info': 'yes',
-                    'confidence': 0.8,
-                    'response_type': 'confirmation_positive'
-                })
-            elif self._is_negative_response(user_message_lower):
-                result.update({
-                    'has_requested_info': True,
-                    'extracted_info': 'no',
-                    'confidence': 0.8,
-                    'response_type': 'confirmation_negative'
-                })
-        
-        elif input_type == InputType.CLARIFICATION:
-            # Any substantive response counts as clarification
-            if len(user_message.strip()) > 5:
-                result.update({
-                    'has_requested_info': True,
-                    'extracted_info': user_message.strip(),
-                    'confidence': 0.6,
-                    'response_type': 'clarification'
-                })
-        
-        elif input_type == InputType.CHOICE:
-            # Look for choice indicators
-            choice = self._extract_choice(user_message_lower)
-            if choice:
-                result.update({
-                    'has_requested_info': True,
-                    'extracted_info': choice,
-                    'confidence': 0.7,
-                    'response_type': 'choice'
-                })
-        
-        elif input_type == InputType.GENERAL:
-            # Any response counts for general questions
-            if len(user_message.strip()) > 0:
-                result.update({
-                    'has_requested_info': True,
-                    'extracted_info': user_message.strip(),
-                    'confidence': 0.5,
-                    'response_type': 'general'
-                })
-        
-        logger.debug(f"User response analysis: {result}")
+        # waiting_for['type'] is the InputType value; dispatch on it directly
+        handler = self._response_handlers[waiting_for['type']]
+        provided = handler(user_message, user_message_lower, user_words)
+        if provided:
+            result.update(provided)
+            result['has_requested_info'] = True
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("User response analysis: %s", result)
         return result
     
+    def _match_delivery_number(
+        self, user_message: str, user_message_lower: str, user_words: FrozenSet[str]
+    ) -> Optional[Dict[str, Any]]:
+        """Take the first delivery number in the reply"""
+        delivery_numbers = self._extract_delivery_numbers(user_message)
+        if delivery_numbers:
+            return {
+                'extracted_info': delivery_numbers[0],  # Take first found
+                'confidence': 0.9,
+                'response_type': 'delivery_number'
+            }
+        return None
+    
+    def _match_confirmation(
+        self, user_message: str, user_message_lower: str, user_words: FrozenSet[str]
+    ) -> Optional[Dict[str, Any]]:
+        """Accept a yes or no reply"""
+        if self._is_positive_response(user_words):
+            return {
+                'extracted_info': 'yes',
+                'confidence': 0.8,
+                'response_type': 'confirmation_positive'
+            }
+        if self._is_negative_response(user_words):
+            return {
+                'extracted_info': 'no',
+                'confidence': 0.8,
+                'response_type': 'confirmation_negative'
+            }
+        return None
+    
+    def _match_clarification(
+        self, user_message: str, user_message_lower: str, user_words: FrozenSet[str]
+    ) -> Optional[Dict[str, Any]]:
+        """Any substantive response counts as clarification"""
+        stripped = user_message.strip()
+        if len(stripped) > 5:
+            return {
+                'extracted_info': stripped,
+                'confidence': 0.6,
+                'response_type': 'clarification'
+            }
+        return None
+    
+    def _match_choice(
+        self, user_message: str, user_message_lower: str, user_words: FrozenSet[str]
+    ) -> Optional[Dict[str, Any]]:
+        """Look for choice indicators"""
+        choice = self._extract_choice(user_message_lower)
+        if choice:
+            return {
+                'extracted_info': choice,
+                'confidence': 0.7,
+                'response_type': 'choice'
+            }
+        return None
+    
+    def _match_general(
+        self, user_message: str, user_message_lower: str, user_words: FrozenSet[str]
+    ) -> Optional[Dict[str, Any]]:
+        """Any response counts for general questions"""
+        stripped = user_message.strip()
+        if stripped:
+            return {
+                'extracted_info': stripped,
+                'confidence': 0.5,
+                'response_type': 'general'
+            }
+        return None
+    
     def _extract_delivery_numbers(self, text: str) -> List[str]:
         """
         Extract potential delivery numbers from text.
@@ -330,29 +565,33 @@ class ConversationFlowManager:
             List of potential delivery numbers
         """
         
-        delivery_numbers = []
-        
-        for pattern in self.delivery_number_patterns:
-            matches = re.findall(pattern, text.upper())
-            delivery_numbers.extend(matches)
+        # Ordered dedup, then stable-sort so standard-format numbers come
+        # first, then numeric ones, then other alphanumeric matches
+        delivery_numbers = list(dict.fromkeys(self.delivery_number_pattern.findall(text.upper())))
+        delivery_numbers.sort(key=self._delivery_number_rank)
         
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_numbers = []
-        for num in delivery_numbers:
-            if num not in seen:
-                seen.add(num)
-                unique_numbers.append(num)
-        
-        return unique_numbers
+        return delivery_numbers
+    
+    @staticmethod
+    def _delivery_number_rank(number: str) -> int:
+        """Rank a delivery number by the most specific format it matches"""
+        for rank, pattern in enumerate(_DELIVERY_NUMBER_RANKS):
+            if pattern.fullmatch(number):
+                return rank
+        return len(_DELIVERY_NUMBER_RANKS)
     
-    def _is_positive_response(self, text: str) -> bool:
-        """Check if text contains positive response"""
-        return any(re.search(pattern, text) for pattern in self.positive_responses)
+    @staticmethod
+    def _tokenize(text: str) -> List[str]:
+        """Split lowercased text into words (the same word boundaries as regex \\b)"""
+        return _WORD_PATTERN.findall(text)
     
-    def _is_negative_response(self, text: str) -> bool:
-        """Check if text contains negative response"""
-        return any(re.search(pattern, text) for pattern in self.negative_responses)
+    def _is_positive_response(self, words: FrozenSet[str]) -> bool:
+        """Check if the message words contain a positive response"""
+        return not self.positive_responses.isdisjoint(words)
+    
+    def _is_negative_response(self, words: FrozenSet[str]) -> bool:
+        """Check if the message words contain a negative response"""
+        return not self.negative_responses.isdisjoint(words)
     
     def _extract_choice(self, text: str) -> Optional[str]:
         """
@@ -365,28 +604,25 @@ class ConversationFlowManager:
             Extracted choice or None
         """
         
-        # Look for numbered choices
-        number_match = re.search(r'\b([1-9])\b', text)
-        if number_match:
-            return f"option_{number_match.group(1)}"
-        
-        # Look for lettered choices
-        letter_match = re.search(r'\b([a-e])\b', text)
-        if letter_match:
-            return f"option_{letter_match.group(1)}"
-        
-        # Look for first/second/etc
-        ordinal_patterns = {
-            r'\bfirst\b': 'option_1',
-            r'\bsecond\b': 'option_2',
-            r'\bthird\b': 'option_3',
-            r'\bfourth\b': 'option_4',
-            r'\bfifth\b': 'option_5'
-        }
+        # A number anywhere wins, then the first letter, then the lowest ordinal
+        letter = None
+        ordinal = None
         
-        for pattern, choice in ordinal_patterns.items():
-            if re.search(pattern, text):
-                return choice
+        for match in _CHOICE_PATTERN.finditer(text):
+            kind = match.lastgroup
+            if kind == 'number':
+                return f"option_{match.group('number')}"
+            if kind == 'letter':
+                if letter is None:
+                    letter = match.group('letter')
+            elif ordinal is None or _ORDINAL_RANKS[match.group('ordinal')] < _ORDINAL_RANKS[ordinal]:
+                ordinal = match.group('ordinal')
+        
+        if letter:
+            return f"option_{letter}"
+        
+        if ordinal:
+            return _ORDINAL_CHOICES[ordinal]
         
         return None
     
@@ -404,19 +640,11 @@ class ConversationFlowManager:
         
         attempts = 0
         input_type = waiting_for['type']
-        patterns = waiting_for.get('patterns', [])
         
         for message in reversed(conversation_history):
             if message.role == 'assistant':
-                message_lower = message.content.lower()
-                
                 # Check if this message contains the same request
-                pattern_matches = any(
-                    re.search(pattern, message_lower) 
-                    for pattern in patterns
-                )
-                
-                if pattern_matches:
+                if _repeats_request(input_type, message.content):
                     attempts += 1
                 else:
                     # Stop counting if we hit a different type of message
@@ -424,34 +652,30 @@ class ConversationFlowManager:
         
         return attempts
     
-    def _should_complete_conversation(self, conversation_history: List[ConversationMessage], current_message: str) -> bool:
+    def _should_complete_conversation(
+        self, 
+        conversation_history: List[ConversationMessage], 
+        message_lower: str,
+        message_words: FrozenSet[str]
+    ) -> bool:
         """
         Determine if conversation should be marked as completed.
         
         Args:
             conversation_history: Conversation history
-            current_message: Current user message
+            message_lower: Lowercased current user message
+            message_words: Words of the lowercased message
             
         Returns:
             True if conversation should be completed
         """
         
-        completion_indicators = [
-            r'\bthank\s*you\b',
-            r'\bthanks\b',
-            r'\bgoodbye\b',
-            r'\bbye\b',
-            r'\bdone\b',
-            r'\bfinished\b',
-            r'\bno\s*more\s*questions\b',
-            r'\bthat\'s\s*all\b'
-        ]
-        
-        message_lower = current_message.lower()
+        if not _COMPLETION_WORDS.isdisjoint(message_words):
+            return True
         
-        for pattern in completion_indicators:
-            if re.search(pattern, message_lower):
-                return True
+        if (any(keyword in message_lower for keyword in _COMPLETION_PHRASE_KEYWORDS)
+                and _COMPLETION_PHRASES.search(message_lower)):
+            return True
         
         # Check conversation length
         if len(conversation_history) >= self.settings.guardrails.max_conversation_length:
@@ -462,45 +686,12 @@ class ConversationFlowManager:
     def _get_input_description(self, input_type: InputType) -> str:
         """Get human-readable description of input type"""
         
-        descriptions = {
-            InputType.DELIVERY_NUMBER: "delivery or tracking number",
-            InputType.CONFIRMATION: "confirmation (yes/no)",
-            InputType.CLARIFICATION: "clarification or additional details",
-            InputType.CHOICE: "selection from available options",
-            InputType.GENERAL: "general information"
-        }
-        
-        return descriptions.get(input_type, "information")
+        return _INPUT_DESCRIPTIONS.get(input_type, "information")
     
     def _get_input_alternatives(self, input_type: InputType) -> List[str]:
         """Get alternative ways to provide the requested input"""
         
-        alternatives = {
-            InputType.DELIVERY_NUMBER: [
-                "tracking number",
-                "package ID",
-                "shipment number",
-                "order number"
-            ],
-            InputType.CONFIRMATION: [
-                "yes",
-                "no",
-                "confirm",
-                "cancel"
-            ],
-            InputType.CLARIFICATION: [
-                "provide more details",
-                "specify what you mean",
-                "explain further"
-            ],
-            InputType.CHOICE: [
-                "select option number",
-                "choose by letter",
-                "say 'first', 'second', etc."
-            ]
-        }
-        
-        return alternatives.get(input_type, [])
+        return _INPUT_ALTERNATIVES.get(input_type, [])
     
     def _is_urgent_request(self, ai_message: str) -> bool:
         """
@@ -513,15 +704,7 @@ class ConversationFlowManager:
             True if request should be considered urgent
         """
         
-        urgent_indicators = [
-            r'please\s*provide',
-            r'need\s*to\s*know',
-            r'required',
-            r'must\s*have',
-            r'important'
-        ]
-        
-        return any(re.search(pattern, ai_message) for pattern in urgent_indicators)
+        return _URGENT_INDICATORS.search(ai_message) is not None
     
     def get_conversation_summary(self, conversation_history: List[ConversationMessage]) -> Dict[str, Any]:
         """
@@ -544,8 +727,20 @@ class ConversationFlowManager:
                 'status': 'empty'
             }
         
-        user_messages = [msg for msg in conversation_history if msg.role == 'user']
-        ai_messages = [msg for msg in conversation_history if msg.role == 'assistant']
+        # Count roles and collect tools in one pass over the history
+        user_count = 0
+        ai_count = 0
+        tools_used = set()
+        for msg in conversation_history:
+            role = msg.role
+            if role == 'user':
+                user_count += 1
+            elif role == 'assistant':
+                ai_count += 1
+                # This would be enhanced to actually track tool usage
+                content_lower = msg.content.lower()
+                if 'tracked' in content_lower and 'delivery' in content_lower:
+                    tools_used.add('delivery_tracker')
         
         # Calculate duration
         if len(conversation_history) > 1:
@@ -555,18 +750,11 @@ class ConversationFlowManager:
         else:
             duration = 0
         
-        # Extract tools used
-        tools_used = []
-        for msg in ai_messages:
-            # This would be enhanced to actually track tool usage
-            if 'delivery' in msg.content.lower() and 'tracked' in msg.content.lower():
-                tools_used.append('delivery_tracker')
-        
         return {
             'total_messages': len(conversation_history),
-            'user_messages': len(user_messages),
-            'ai_messages': len(ai_messages),
-            'tools_used': list(set(tools_used)),
+            'user_messages': user_count,
+            'ai_messages': ai_count,
+            'tools_used': list(tools_used),
             'duration_minutes': round(duration, 2),
             'status': self._determine_conversation_status(conversation_history)
         }
@@ -588,7 +776,9 @@ class ConversationFlowManager:
         last_message = conversation_history[-1]
         
         if last_message.role == 'user':
-            if self._should_complete_conversation(conversation_history, last_message.content):
+            content_lower = last_message.content.lower()
+            content_words = frozenset(self._tokenize(content_lower))
+            if self._should_complete_conversation(conversation_history, content_lower, content_words):
                 return 'completed_by_user'
             else:
                 return 'awaiting_response'
@@ -8,7 +8,11 @@ and behavioral restrictions based on configuration settings.
 
 import logging
 import re
-from typing import Dict, Any, List, Optional, Set
+import time
+from collections import OrderedDict, deque
+from functools import lru_cache
+from itertools import islice
+from typing import Deque, Dict, Any, FrozenSet, List, Optional, Set
 from datetime import datetime, timedelta
 
 from ..config import Settings
@@ -17,6 +21,108 @@ from ..utils.exceptions import ValidationError, GuardrailsViolation
 
 logger = logging.getLogger(__name__)
 
+# All patterns are compiled once at import and shared by every instance.
+# Keyword patterns match case-insensitively rather than on a lowercased copy
+
+# Content filtering patterns
+_INAPPROPRIATE_PATTERNS = [
+    re.compile(r'\b(?:spam|test|abuse|harmful)\b', re.IGNORECASE),
+    re.compile(r'\b(?:hack|exploit|bypass)\b', re.IGNORECASE),
+    re.compile(r'\b(?:illegal|fraud|scam)\b', re.IGNORECASE)
+]
+
+# Off-topic patterns (when general chat is disabled)
+_OFF_TOPIC_PATTERNS = [
+    re.compile(r'\b(?:weather|sports|politics|entertainment)\b', re.IGNORECASE),
+    re.compile(r'\b(?:recipe|cooking|travel|music)\b', re.IGNORECASE),
+    re.compile(r'\b(?:joke|story|poem|creative)\b', re.IGNORECASE),
+    re.compile(r'\b(?:personal|relationship|advice)\b', re.IGNORECASE)
+]
+
+# Tool-related keywords that should be allowed
+_TOOL_KEYWORD_PATTERNS = [
+    re.compile(r'\b(?:delivery|tracking|shipment|package)\b', re.IGNORECASE),
+    re.compile(r'\b(?:order|track|status|update)\b', re.IGNORECASE),
+    re.compile(r'\b(?:help|assist|support|service)\b', re.IGNORECASE)
+]
+
+# Greetings and basic courtesy
+_COURTESY_PATTERNS = [
+    re.compile(r'\b(?:hello|hi|hey|thanks|thank you|please|help)\b', re.IGNORECASE),
+    re.compile(r'\b(?:good morning|good afternoon|good evening)\b', re.IGNORECASE)
+]
+
+# Sensitive information patterns
+_SENSITIVE_PATTERNS = [
+    re.compile(r'\b(?:\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4})\b'),  # Credit card
+    re.compile(r'\b(?:\d{3}[-\s]?\d{2}[-\s]?\d{4})\b'),             # SSN
+    re.compile(r'\b(?:[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})\b')  # Email (basic)
+]
+
+# Words in recent AI messages that mark a tool-related conversation (substring match)
+_TOOL_CONTEXT_INDICATORS = re.compile(
+    r'delivery|tracking|shipment|package|status|update|track|order', re.IGNORECASE
+)
+
+# Most violations kept per session (older ones also expire after 24 hours)
+_MAX_VIOLATIONS_PER_SESSION = 1000
+_VIOLATION_RETENTION_SECONDS = 24 * 60 * 60
+
+# Most sessions tracked at once; the one with the oldest last violation is dropped first
+_MAX_TRACKED_SESSIONS = 10000
+
+# Every sensitive pattern needs a digit or an '@'; messages without one skip them
+_SENSITIVE_TRIGGER = re.compile(r'[\d@]')
+
+# Patterns that AI shouldn't include
+_AI_INAPPROPRIATE_PATTERNS = [
+    re.compile(r'I cannot|I can\'t|I don\'t know', re.IGNORECASE),  # Too many negative responses
+    re.compile(r'error|failed|broken', re.IGNORECASE),              # Technical errors exposed
+    re.compile(r'admin|system|debug|internal', re.IGNORECASE)       # System information
+]
+
+# System information the AI shouldn't reveal
+_SYSTEM_INFO_PATTERNS = [
+    re.compile(r'database|sql|query', re.IGNORECASE),
+    re.compile(r'server|host|port|endpoint', re.IGNORECASE),
+    re.compile(r'api key|token|secret|password', re.IGNORECASE),
+    re.compile(r'config|configuration|settings', re.IGNORECASE),
+    re.compile(r'internal|backend|infrastructure', re.IGNORECASE)
+]
+
+
+def _combine(patterns: List[re.Pattern], capture: bool = False) -> re.Pattern:
+    """
+    Fold a pattern list into one alternation so the text is scanned once.
+    
+    Args:
+        patterns: Compiled patterns sharing the same flags
+        capture: Wrap each pattern in a numbered group (group n = patterns[n - 1])
+        
+    Returns:
+        Compiled alternation matching wherever any of the patterns match
+    """
+    
+    template = '({})' if capture else '(?:{})'
+    return re.compile('|'.join(template.format(p.pattern) for p in patterns), patterns[0].flags)
+
+
+# One alternation per category for the common no-match path; the lists above
+# are only walked once a match is known, to record which pattern hit
+_INAPPROPRIATE_ANY = _combine(_INAPPROPRIATE_PATTERNS)
+_OFF_TOPIC_ANY = _combine(_OFF_TOPIC_PATTERNS)
+_TOOL_KEYWORD_ANY = _combine(_TOOL_KEYWORD_PATTERNS)
+_COURTESY_ANY = _combine(_COURTESY_PATTERNS)
+_SENSITIVE_ANY = _combine(_SENSITIVE_PATTERNS)
+_AI_INAPPROPRIATE_ANY = _combine(_AI_INAPPROPRIATE_PATTERNS, capture=True)
+_SYSTEM_INFO_ANY = _combine(_SYSTEM_INFO_PATTERNS)
+
+
+@lru_cache(maxsize=1024)
+def _word_set(text: str) -> FrozenSet[str]:
+    """Lowercased words of a message, cached by content across validations"""
+    return frozenset(text.lower().split())
+
 
 class GuardrailsManager:
     """
@@ -30,40 +136,39 @@ class GuardrailsManager:
     - Track violations and patterns
     """
     
+    # One long-lived instance per process; fixed attributes, no __dict__
+    __slots__ = (
+        'settings',
+        'inappropriate_patterns',
+        'off_topic_patterns',
+        'tool_keywords',
+        'sensitive_patterns',
+        'violation_history',
+        '_violations_by_type'
+    )
+    
     def __init__(self, settings: Settings):
         self.settings = settings
         
         # Content filtering patterns
-        self.inappropriate_patterns = [
-            r'\b(?:spam|test|abuse|harmful)\b',
-            r'\b(?:hack|exploit|bypass)\b',
-            r'\b(?:illegal|fraud|scam)\b'
-        ]
+        self.inappropriate_patterns = _INAPPROPRIATE_PATTERNS
         
         # Off-topic patterns (when general chat is disabled)
-        self.off_topic_patterns = [
-            r'\b(?:weather|sports|politics|entertainment)\b',
-            r'\b(?:recipe|cooking|travel|music)\b',
-            r'\b(?:joke|story|poem|creative)\b',
-            r'\b(?:personal|relationship|advice)\b'
-        ]
+        self.off_topic_patterns = _OFF_TOPIC_PATTERNS
         
         # Tool-related keywords that should be allowed
-        self.tool_keywords = [
-            r'\b(?:delivery|tracking|shipment|package)\b',
-            r'\b(?:order|track|status|update)\b',
-            r'\b(?:help|assist|support|service)\b'
-        ]
+        self.tool_keywords = _TOOL_KEYWORD_PATTERNS
         
         # Sensitive information patterns
-        self.sensitive_patterns = [
-            r'\b(?:\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4})\b',  # Credit card
-            r'\b(?:\d{3}[-\s]?\d{2}[-\s]?\d{4})\b',             # SSN
-            r'\b(?:[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})\b'  # Email (basic)
-        ]
+        self.sensitive_patterns = _SENSITIVE_PATTERNS
         
         # Violation tracking
-        self.violation_history: Dict[str, List[Dict[str, Any]]] = {}
+        # Ordered by each session's latest violation, oldest first, so idle and
+        # expired sessions are evicted from the front
+        self.violation_history: Dict[str, Deque[Dict[str, Any]]] = OrderedDict()
+        
+        # The same violations indexed by session and type, for recent-count lookups
+        self._violations_by_type: Dict[str, Dict[str, Deque[Dict[str, Any]]]] = {}
         
         logger.debug("GuardrailsManager initialized")
     
@@ -71,7 +176,9 @@ class GuardrailsManager:
         self, 
         message: str, 
         session_id: str, 
-        conversation_history: List[ConversationMessage]
+        conversation_history: List[ConversationMessage],
+        message_count: Optional[int] = None,
+        session_start: Optional[datetime] = None
     ) -> str:
         """
         Validate user message against all guardrails.
@@ -79,7 +186,9 @@ class GuardrailsManager:
         Args:
             message: User message to validate
             session_id: Session identifier
-            conversation_history: Previous conversation
+            conversation_history: Previous conversation (may be only the recent window)
+            message_count: Total messages in the session, if history is windowed
+            session_start: Timestamp of the first message, if history is windowed
             
         Returns:
             Validated (possibly modified) message
@@ -105,7 +214,9 @@ class GuardrailsManager:
                 self._check_tool_relevance(message, conversation_history, session_id)
             
             # Check conversation limits
-            self._check_conversation_limits(conversation_history, session_id)
+            self._check_conversation_limits(
+                conversation_history, session_id, message_count, session_start
+            )
             
             # Check for repetitive patterns
             self._check_repetitive_patterns(message, conversation_history, session_id)
@@ -165,6 +276,44 @@ class GuardrailsManager:
             # Don't block AI responses unless critical
             return response
     
+    def validate_ai_response_chunk(
+        self, 
+        chunk: str, 
+        session_id: str, 
+        emitted_length: int = 0
+    ) -> str:
+        """
+        Validate one sentence-buffered window of a streamed AI response.
+        
+        Applies the content and leakage checks of validate_ai_response to the
+        window, and the overall length limit to the response as a whole.
+        
+        Args:
+            chunk: Text window to validate
+            session_id: Session identifier
+            emitted_length: Characters of the response already sent
+            
+        Returns:
+            Validated window (truncated, or empty, once the length limit is hit)
+        """
+        
+        try:
+            # Check response length across the whole stream
+            if emitted_length >= 4800:
+                return ""
+            if emitted_length + len(chunk) > 5000:
+                logger.warning("Streamed AI response too long, truncating")
+                return chunk[:4800 - emitted_length] + "... [Response truncated for length]"
+            
+            self._check_ai_inappropriate_content(chunk, session_id)
+            self._check_system_information_leakage(chunk, session_id)
+            
+            return chunk
+            
+        except Exception as e:
+            logger.error(f"Error validating AI response chunk: {str(e)}")
+            return chunk
+    
     def _check_message_length(self, message: str) -> None:
         """Check if message length is within limits"""
         
@@ -184,14 +333,15 @@ class GuardrailsManager:
         if not self.settings.guardrails.content_filter_enabled:
             return
         
-        message_lower = message.lower()
+        if not _INAPPROPRIATE_ANY.search(message):
+            return
         
         for pattern in self.inappropriate_patterns:
-            if re.search(pattern, message_lower):
+            if pattern.search(message):
                 violation = {
                     'type': 'inappropriate_content',
-                    'pattern': pattern,
-                    'timestamp': datetime.utcnow(),
+                    'pattern': pattern.pattern,
+                    'timestamp': time.time(),
                     'message_excerpt': message[:50] + "..." if len(message) > 50 else message
                 }
                 
@@ -205,13 +355,16 @@ class GuardrailsManager:
     def _check_sensitive_information(self, message: str, session_id: str) -> None:
         """Check for sensitive information in user messages"""
         
+        if not _SENSITIVE_TRIGGER.search(message) or not _SENSITIVE_ANY.search(message):
+            return
+        
         for pattern in self.sensitive_patterns:
-            matches = re.findall(pattern, message)
+            matches = pattern.findall(message)
             if matches:
                 violation = {
                     'type': 'sensitive_information',
-                    'pattern': pattern,
-                    'timestamp': datetime.utcnow(),
+                    'pattern': pattern.pattern,
+                    'timestamp': time.time(),
                     'matches_count': len(matches)
                 }
                 
@@ -231,39 +384,23 @@ class GuardrailsManager:
     ) -> None:
         """Check if message is relevant to available tools when general chat is disabled"""
         
-        message_lower = message.lower()
-        
         # Check if message contains tool-related keywords
-        tool_relevant = any(
-            re.search(pattern, message_lower) 
-            for pattern in self.tool_keywords
-        )
+        tool_relevant = _TOOL_KEYWORD_ANY.search(message) is not None
         
         # Allow greetings and basic courtesy
-        courtesy_patterns = [
-            r'\b(?:hello|hi|hey|thanks|thank you|please|help)\b',
-            r'\b(?:good morning|good afternoon|good evening)\b'
-        ]
-        
-        is_courtesy = any(
-            re.search(pattern, message_lower)
-            for pattern in courtesy_patterns
-        )
+        is_courtesy = _COURTESY_ANY.search(message) is not None
         
         # Check if it's a follow-up to a tool-related conversation
         recent_tool_context = self._has_recent_tool_context(conversation_history)
         
         if not (tool_relevant or is_courtesy or recent_tool_context):
             # Check if it's clearly off-topic
-            off_topic = any(
-                re.search(pattern, message_lower)
-                for pattern in self.off_topic_patterns
-            )
+            off_topic = _OFF_TOPIC_ANY.search(message) is not None
             
             if off_topic or len(message.split()) > 3:  # Longer messages are more likely off-topic
                 violation = {
                     'type': 'off_topic',
-                    'timestamp': datetime.utcnow(),
+                    'timestamp': time.time(),
                     'message_excerpt': message[:50] + "..." if len(message) > 50 else message
                 }
                 
@@ -278,13 +415,15 @@ class GuardrailsManager:
     def _check_conversation_limits(
         self, 
         conversation_history: List[ConversationMessage], 
-        session_id: str
+        session_id: str,
+        message_count: Optional[int] = None,
+        session_start: Optional[datetime] = None
     ) -> None:
         """Check conversation length and time limits"""
         
         # Check message count
         max_messages = self.settings.guardrails.max_conversation_length
-        current_count = len(conversation_history)
+        current_count = len(conversation_history) if message_count is None else message_count
         
         if current_count >= max_messages:
             logger.info(f"Conversation limit reached for session {session_id[:16]}...")
@@ -294,8 +433,10 @@ class GuardrailsManager:
             )
         
         # Check session age
-        if conversation_history:
+        if session_start is None and conversation_history:
             session_start = conversation_history[0].timestamp
+        
+        if session_start:
             session_age = datetime.utcnow() - session_start
             max_age = timedelta(minutes=self.settings.guardrails.session_timeout_minutes)
             
@@ -317,18 +458,27 @@ class GuardrailsManager:
         if len(conversation_history) < 2:
             return
         
-        # Get recent user messages
-        recent_user_messages = [
-            msg.content for msg in conversation_history[-5:]
-            if msg.role == 'user'
-        ]
+        # Count exact duplicates and very similar messages among recent user
+        # messages in one pass (the new message is split only once)
+        message_words = _word_set(message)
+        duplicate_count = 0
+        similar_count = 0
+        
+        for msg in islice(reversed(conversation_history), 5):
+            if msg.role != 'user':
+                continue
+            if msg.content == message:
+                # Identical messages are also maximally similar
+                duplicate_count += 1
+                similar_count += 1
+            elif similar_count < 3 and self._calculate_similarity(message, msg.content, message_words) > 0.8:
+                similar_count += 1
         
         # Check for exact duplicates
-        duplicate_count = recent_user_messages.count(message)
         if duplicate_count >= 2:
             violation = {
                 'type': 'repetitive_message',
-                'timestamp': datetime.utcnow(),
+                'timestamp': time.time(),
                 'duplicate_count': duplicate_count
             }
             
@@ -341,11 +491,6 @@ class GuardrailsManager:
             )
         
         # Check for very similar messages
-        similar_count = sum(
-            1 for recent_msg in recent_user_messages
-            if self._calculate_similarity(message, recent_msg) > 0.8
-        )
-        
         if similar_count >= 3:
             logger.warning(f"Similar messages detected in session {session_id[:16]}...")
             raise ValidationError(
@@ -367,7 +512,7 @@ class GuardrailsManager:
             
             violation = {
                 'type': 'short_message',
-                'timestamp': datetime.utcnow(),
+                'timestamp': time.time(),
                 'message_length': len(message)
             }
             self._record_violation(session_id, violation)
@@ -375,19 +520,10 @@ class GuardrailsManager:
     def _check_ai_inappropriate_content(self, response: str, session_id: str) -> None:
         """Check AI response for inappropriate content"""
         
-        # Patterns that AI shouldn't include
-        ai_inappropriate_patterns = [
-            r'I cannot|I can\'t|I don\'t know',  # Too many negative responses
-            r'error|failed|broken',              # Technical errors exposed
-            r'admin|system|debug|internal'       # System information
-        ]
-        
-        response_lower = response.lower()
-        negative_pattern_count = 0
-        
-        for pattern in ai_inappropriate_patterns:
-            if re.search(pattern, response_lower):
-                negative_pattern_count += 1
+        # Count distinct patterns hit, by their group number, in one scan
+        negative_pattern_count = len({
+            match.lastindex for match in _AI_INAPPROPRIATE_ANY.finditer(response)
+        })
         
         # If too many negative patterns, log but don't block
         if negative_pattern_count > 2:
@@ -396,21 +532,9 @@ class GuardrailsManager:
     def _check_system_information_leakage(self, response: str, session_id: str) -> None:
         """Check if AI response leaks system information"""
         
-        system_info_patterns = [
-            r'database|sql|query',
-            r'server|host|port|endpoint',
-            r'api key|token|secret|password',
-            r'config|configuration|settings',
-            r'internal|backend|infrastructure'
-        ]
-        
-        response_lower = response.lower()
-        
-        for pattern in system_info_patterns:
-            if re.search(pattern, response_lower):
-                logger.warning(f"Potential system info leak in AI response for session {session_id[:16]}...")
-                # In production, you might want to scrub this content
-                break
+        if _SYSTEM_INFO_ANY.search(response):
+            logger.warning(f"Potential system info leak in AI response for session {session_id[:16]}...")
+            # In production, you might want to scrub this content
     
     def _check_response_relevance(self, response: str, user_message: str, session_id: str) -> None:
         """Check if AI response is relevant to user's query"""
@@ -426,77 +550,97 @@ class GuardrailsManager:
     def _has_recent_tool_context(self, conversation_history: List[ConversationMessage]) -> bool:
         """Check if recent conversation involved tool usage"""
         
-        recent_messages = conversation_history[-6:]  # Last 6 messages
-        
-        for message in recent_messages:
-            if message.role == 'assistant':
-                message_lower = message.content.lower()
-                tool_indicators = [
-                    'delivery', 'tracking', 'shipment', 'package',
-                    'status', 'update', 'track', 'order'
-                ]
-                
-                if any(indicator in message_lower for indicator in tool_indicators):
-                    return True
+        recent_messages = islice(reversed(conversation_history), 6)  # Last 6 messages
         
-        return False
+        return any(
+            message.role == 'assistant' and _TOOL_CONTEXT_INDICATORS.search(message.content)
+            for message in recent_messages
+        )
     
-    def _calculate_similarity(self, msg1: str, msg2: str) -> float:
+    def _calculate_similarity(self, msg1: str, msg2: str, words1: Optional[FrozenSet[str]] = None) -> float:
         """Calculate similarity between two messages (simple implementation)"""
         
         if msg1 == msg2:
             return 1.0
         
         # Simple word-based similarity
-        words1 = set(msg1.lower().split())
-        words2 = set(msg2.lower().split())
+        if words1 is None:
+            words1 = _word_set(msg1)
+        words2 = _word_set(msg2)
         
         if not words1 or not words2:
             return 0.0
         
-        intersection = words1.intersection(words2)
-        union = words1.union(words2)
-        
-        return len(intersection) / len(union) if union else 0.0
+        # Jaccard index; the union size follows from the intersection size
+        intersection = len(words1 & words2)
+        return intersection / (len(words1) + len(words2) - intersection)
     
     def _record_violation(self, session_id: str, violation: Dict[str, Any]) -> None:
         """Record a guardrail violation for tracking"""
         
-        if session_id not in self.violation_history:
-            self.violation_history[session_id] = []
+        violations = self.violation_history.get(session_id)
+        if violations is None:
+            violations = self.violation_history[session_id] = deque(maxlen=_MAX_VIOLATIONS_PER_SESSION)
+        else:
+            self.violation_history.move_to_end(session_id)
         
-        self.violation_history[session_id].append(violation)
+        by_type = self._violations_by_type.setdefault(session_id, {})
+        typed = by_type.get(violation['type'])
+        if typed is None:
+            typed = by_type[violation['type']] = deque(maxlen=_MAX_VIOLATIONS_PER_SESSION)
         
-        # Keep only recent violations (last 24 hours)
-        cutoff_time = datetime.utcnow() - timedelta(hours=24)
-        self.violation_history[session_id] = [
-            v for v in self.violation_history[session_id]
-            if v['timestamp'] > cutoff_time
-        ]
+        violations.append(violation)
+        typed.append(violation)
+        
+        # Keep only recent violations (last 24 hours); they are in time order
+        cutoff_time = time.time() - _VIOLATION_RETENTION_SECONDS
+        for recorded in (violations, typed):
+            while recorded and recorded[0]['timestamp'] <= cutoff_time:
+                recorded.popleft()
+        
+        self._evict_sessions(cutoff_time)
         
         logger.debug(f"Recorded violation for session {session_id[:16]}...: {violation['type']}")
     
+    def _evict_sessions(self, cutoff_time: float) -> None:
+        """Drop sessions whose violations have all expired, and the least recent beyond the cap"""
+        
+        while self.violation_history:
+            oldest_id, oldest = next(iter(self.violation_history.items()))
+            if len(self.violation_history) <= _MAX_TRACKED_SESSIONS and oldest and oldest[-1]['timestamp'] > cutoff_time:
+                break
+            
+            del self.violation_history[oldest_id]
+            self._violations_by_type.pop(oldest_id, None)
+    
     def _get_recent_violations(self, session_id: str, violation_type: str, minutes: int = 60) -> List[Dict[str, Any]]:
         """Get recent violations of a specific type"""
         
-        if session_id not in self.violation_history:
+        typed = self._violations_by_type.get(session_id, {}).get(violation_type)
+        if not typed:
             return []
         
-        cutoff_time = datetime.utcnow() - timedelta(minutes=minutes)
+        cutoff_time = time.time() - minutes * 60
         
-        return [
-            v for v in self.violation_history[session_id]
-            if v['type'] == violation_type and v['timestamp'] > cutoff_time
-        ]
+        # Newest are at the right; stop at the first one outside the window
+        recent = []
+        for v in reversed(typed):
+            if v['timestamp'] <= cutoff_time:
+                break
+            recent.append(v)
+        
+        recent.reverse()
+        return recent
     
     def get_session_violations(self, session_id: str) -> List[Dict[str, Any]]:
         """Get all violations for a session"""
-        return self.violation_history.get(session_id, [])
+        return list(self.violation_history.get(session_id, ()))
     
     def clear_session_violations(self, session_id: str) -> None:
         """Clear violations for a session"""
         if session_id in self.violation_history:
             del self.violation_history[session_id]
+        self._violations_by_type.pop(session_id, None)
     
     def get_violation_summary(self) -> Dict[str, Any]:
         """Get summary of all violations across sessions"""
@@ -0,0 +1,128 @@
+"""
+Response Cache
+==============
+
+Redis-backed cache of AI responses for repeated prompts. A response is
+reused only when the system prompt, conversation flow state, the
+conversation history the LLM would see and the user message all match.
+"""
+
+import hashlib
+import logging
+from typing import Any, Dict, List, Optional
+
+import orjson
+
+from ..config import Settings
+from ..database.schemas import ConversationMessage
+
+try:
+    from redis import asyncio as redis_asyncio
+except ImportError:  # redis is only needed when the cache is enabled
+    redis_asyncio = None
+
+logger = logging.getLogger(__name__)
+
+# Separates key components so adjacent fields cannot run together
+_KEY_SEP = b"\x1f"
+
+
+class ResponseCache:
+    """
+    Exact-match response cache stored in Redis.
+    
+    Lookups and writes never raise: a Redis failure is logged and treated
+    as a cache miss, so the chat pipeline keeps working without the cache.
+    """
+    
+    def __init__(self, settings: Settings):
+        self.ttl_seconds = settings.cache.ttl_seconds
+        # Same window the prompt is built from, so every message that can
+        # shape the answer is part of the key
+        self.history_window = settings.llm.history_window
+        self._client = redis_asyncio.from_url(settings.cache.url)
+        
+        logger.debug("ResponseCache initialized - TTL: %ss", self.ttl_seconds)
+    
+    def make_key(
+        self,
+        system_prefix: str,
+        flow_state: Dict[str, Any],
+        conversation_history: List[ConversationMessage],
+        user_message: str
+    ) -> str:
+        """
+        Build the cache key for a chat turn.
+        
+        Args:
+            system_prefix: Static system prompt (covers mode and available tools)
+            flow_state: Conversation flow state
+            conversation_history: Previous conversation (the last
+                llm.history_window messages are hashed, as in the prompt)
+            user_message: Current user message
+        
+        Returns:
+            Redis key for the turn
+        """
+        
+        parts = [system_prefix.encode(), str(flow_state.get('state', '')).encode()]
+        for msg in conversation_history[-self.history_window:]:
+            parts.append(f"{msg.role}:{msg.content}".encode())
+        parts.append(user_message.encode())
+        
+        return "chat:" + hashlib.blake2b(_KEY_SEP.join(parts), digest_size=16).hexdigest()
+    
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached response.
+        
+        Args:
+            key: Cache key from make_key
+        
+        Returns:
+            Cached response data, or None on a miss or error
+        """
+        
+        try:
+            cached = await self._client.get(key)
+            return orjson.loads(cached) if cached else None
+        
+        except Exception as e:
+            logger.warning("Response cache lookup failed: %s", e)
+            return None
+    
+    async def set(self, key: str, response: Dict[str, Any]) -> None:
+        """
+        Store a response.
+        
+        Args:
+            key: Cache key from make_key
+            response: Response data to cache
+        """
+        
+        try:
+            await self._client.set(key, orjson.dumps(response), ex=self.ttl_seconds)
+        
+        except Exception as e:
+            logger.warning("Response cache write failed: %s", e)
+
+
+def create_response_cache(settings: Settings) -> Optional[ResponseCache]:
+    """
+    Create the response cache if it is enabled.
+    
+    Args:
+        settings: Application settings
+    
+    Returns:
+        ResponseCache, or None when caching is disabled or redis is not installed
+    """
+    
+    if not settings.cache.enabled:
+        return None
+    
+    if redis_asyncio is None:
+        logger.warning("Response cache enabled but the redis package is not installed; caching disabled")
+        return None
+    
+    return ResponseCache(settings)
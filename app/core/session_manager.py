@@ -7,7 +7,7 @@ for persistent storage of chat data.
 """
 
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
@@ -230,10 +230,10 @@ class SessionManager:
         
         Args:
             session_id: Session identifier
-            limit: Maximum number of messages to return
+            limit: Return only the most recent `limit` messages
             
         Returns:
-            List of ConversationMessage objects
+            List of ConversationMessage objects, oldest first
         """
         
         try:
@@ -241,12 +241,14 @@ class SessionManager:
             
             query = self.db.query(DBMessage).filter(
                 DBMessage.session_id == session_id
-            ).order_by(DBMessage.timestamp.asc())
+            )
             
             if limit:
-                query = query.limit(limit)
-            
-            db_messages = query.all()
+                # Newest `limit` messages, flipped back to chronological order
+                db_messages = query.order_by(DBMessage.timestamp.desc()).limit(limit).all()
+                db_messages.reverse()
+            else:
+                db_messages = query.order_by(DBMessage.timestamp.asc()).all()
             
             # Convert to ConversationMessage objects
             conversation_messages = []
@@ -290,6 +292,60 @@ class SessionManager:
             logger.error(f"Database error getting message count: {str(e)}")
             raise DatabaseError(f"Failed to get message count: {str(e)}")
     
+    async def get_history_bounds(self, session_id: str) -> Tuple[int, Optional[datetime]]:
+        """
+        Get the message count and first message time for a session in one query.
+        
+        Args:
+            session_id: Session identifier
+            
+        Returns:
+            Tuple of (message count, timestamp of the first message or None)
+        """
+        
+        try:
+            count, started_at = self.db.query(
+                func.count(),
+                func.min(DBMessage.timestamp)
+            ).filter(
+                DBMessage.session_id == session_id
+            ).one()
+            
+            return count, started_at
+            
+        except SQLAlchemyError as e:
+            logger.error(f"Database error getting history bounds: {str(e)}")
+            raise DatabaseError(f"Failed to get history bounds: {str(e)}")
+    
+    async def get_message_counts(self, session_ids: List[str]) -> Dict[str, int]:
+        """
+        Get total message counts for several sessions in one query.
+        
+        Args:
+            session_ids: Session identifiers
+            
+        Returns:
+            Mapping of session ID to message count (sessions without
+            messages are omitted)
+        """
+        
+        if not session_ids:
+            return {}
+        
+        try:
+            rows = self.db.query(
+                DBMessage.session_id,
+                func.count()
+            ).filter(
+                DBMessage.session_id.in_(session_ids)
+            ).group_by(DBMessage.session_id).all()
+            
+            return {session_id: count for session_id, count in rows}
+            
+        except SQLAlchemyError as e:
+            logger.error(f"Database error getting message counts: {str(e)}")
+            raise DatabaseError(f"Failed to get message counts: {str(e)}")
+    
     async def get_recent_message_count(
         self, 
         session_id: str, 
@@ -413,6 +469,54 @@ class SessionManager:
             logger.error(f"Database error listing sessions: {str(e)}")
             raise DatabaseError(f"Failed to list sessions: {str(e)}")
     
+    async def list_session_summaries(
+        self, 
+        limit: int = 50, 
+        offset: int = 0,
+        active_only: bool = True
+    ) -> List[Tuple[str, Optional[datetime], Optional[datetime], bool, int]]:
+        """
+        List sessions with their message counts.
+        
+        Only the columns needed for a listing are selected, so no ORM
+        objects are built, and messages are counted for the listed page
+        only (see get_message_counts).
+        
+        Args:
+            limit: Maximum number of sessions to return
+            offset: Offset for pagination
+            active_only: Whether to return only active sessions
+            
+        Returns:
+            List of (session_id, created_at, last_activity, is_active, message_count) rows
+        """
+        
+        try:
+            query = self.db.query(
+                ChatSession.session_id,
+                ChatSession.created_at,
+                ChatSession.last_activity,
+                ChatSession.is_active
+            )
+            
+            if active_only:
+                query = query.filter(ChatSession.is_active == True)
+            
+            rows = query.order_by(
+                desc(ChatSession.last_activity)
+            ).offset(offset).limit(limit).all()
+            
+        except SQLAlchemyError as e:
+            logger.error(f"Database error listing session summaries: {str(e)}")
+            raise DatabaseError(f"Failed to list session summaries: {str(e)}")
+        
+        counts = await self.get_message_counts([row[0] for row in rows])
+        
+        return [
+            (session_id, created_at, last_activity, is_active, counts.get(session_id, 0))
+            for session_id, created_at, last_activity, is_active in rows
+        ]
+    
     async def get_statistics(self) -> Dict[str, Any]:
         """
         Get overall chat system statistics.
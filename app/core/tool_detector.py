@@ -83,6 +83,15 @@ class ToolDetector:
             ]
         }
         
+        # Single-pass prefilter: a message with none of the intent or urgency
+        # keywords and no digit (every valid delivery number has one) cannot
+        # score anything for delivery tracking beyond the conversation context
+        self._delivery_prefilter = re.compile('|'.join(
+            self.delivery_patterns['intent_keywords']
+            + self.delivery_patterns['urgency_indicators']
+            + [r'\d']
+        ))
+        
         logger.debug("ToolDetector initialized")
     
     async def analyze_message(
@@ -173,6 +182,20 @@ class ToolDetector:
             )
         
         message_lower = user_message.lower()
+        
+        # Fast path: skip the full pattern scan when only context could count
+        if not self._delivery_prefilter.search(message_lower):
+            context_boost = self._analyze_conversation_context(conversation_history, 'delivery_tracking')
+            if context_boost < self.get_tool_confidence_threshold('delivery_tracker'):
+                return ToolDetectionResult(
+                    tool_required=False,
+                    tool_name=None,
+                    confidence=context_boost,
+                    required_parameters=['delivery_number'],
+                    extracted_parameters={},
+                    reasoning="No delivery tracking patterns in message"
+                )
+        
         confidence_score = 0.0
         reasoning_parts = []
         
@@ -6,9 +6,12 @@ Common dependencies for FastAPI routes including database sessions,
 configuration, logging, and business logic components.
 """
 
+import asyncio
+import functools
 import logging
+import time
 import uuid
-from typing import Generator, Optional
+from typing import Annotated, Generator, NamedTuple, Optional
 from datetime import datetime, timedelta
 
 from fastapi import Depends, HTTPException, Request, status
@@ -19,6 +22,10 @@ from .config import get_settings, Settings
 from .database.connection import get_db
 from .core.session_manager import SessionManager
 from .core.chat_manager import ChatManager
+from .core.conversation_flow import ConversationFlowManager
+from .core.guardrails import GuardrailsManager
+from .core.response_cache import ResponseCache, create_response_cache
+from .core.tool_detector import ToolDetector
 from .llm.llm_factory import LLMFactory
 from .tools.tool_registry import ToolRegistry
 from .utils.exceptions import DatabaseError, ValidationError
@@ -120,11 +127,60 @@ def get_tool_registry() -> ToolRegistry:
     return ToolRegistry.get_instance()
 
 
+# Conversation component dependencies (built once, shared by all requests)
+@functools.lru_cache()
+def get_tool_detector() -> ToolDetector:
+    """
+    Get the shared tool detector instance.
+    
+    Returns:
+        ToolDetector: Tool detection instance
+    """
+    return ToolDetector(ToolRegistry.get_instance(), get_settings())
+
+
+@functools.lru_cache()
+def get_guardrails() -> GuardrailsManager:
+    """
+    Get the shared guardrails manager instance.
+    
+    Returns:
+        GuardrailsManager: Guardrails instance
+    """
+    return GuardrailsManager(get_settings())
+
+
+@functools.lru_cache()
+def get_conversation_flow() -> ConversationFlowManager:
+    """
+    Get the shared conversation flow manager instance.
+    
+    Returns:
+        ConversationFlowManager: Conversation flow instance
+    """
+    return ConversationFlowManager(get_settings())
+
+
+@functools.lru_cache()
+def get_response_cache() -> Optional[ResponseCache]:
+    """
+    Get the shared response cache, if caching is enabled.
+    
+    Returns:
+        Optional[ResponseCache]: Response cache instance, or None
+    """
+    return create_response_cache(get_settings())
+
+
 # Chat Manager dependency
 def get_chat_manager(
     session_manager: SessionManager = Depends(get_session_manager),
     llm_factory: LLMFactory = Depends(get_llm_factory),
     tool_registry: ToolRegistry = Depends(get_tool_registry),
+    tool_detector: ToolDetector = Depends(get_tool_detector),
+    guardrails: GuardrailsManager = Depends(get_guardrails),
+    conversation_flow: ConversationFlowManager = Depends(get_conversation_flow),
+    response_cache: Optional[ResponseCache] = Depends(get_response_cache),
     settings: Settings = Depends(get_app_settings),
     request_id: str = Depends(get_request_id)
 ) -> ChatManager:
@@ -135,6 +191,10 @@ def get_chat_manager(
         session_manager: Session management instance
         llm_factory: LLM factory instance
         tool_registry: Tool registry instance
+        tool_detector: Shared tool detector
+        guardrails: Shared guardrails manager
+        conversation_flow: Shared conversation flow manager
+        response_cache: Shared response cache (None when disabled)
         settings: Application settings
         request_id: Request identifier
         
@@ -145,11 +205,45 @@ def get_chat_manager(
         session_manager=session_manager,
         llm_factory=llm_factory,
         tool_registry=tool_registry,
+        tool_detector=tool_detector,
+        guardrails=guardrails,
+        conversation_flow=conversation_flow,
         settings=settings,
-        request_id=request_id
+        request_id=request_id,
+        response_cache=response_cache
     )
 
 
+# Request context dependency
+class ChatContext(NamedTuple):
+    """Per-request objects shared by the chat endpoints"""
+    chat_manager: ChatManager
+    request_id: str
+    settings: Settings
+
+
+async def get_chat_context(
+    chat_manager: ChatManager = Depends(get_chat_manager),
+    request_id: str = Depends(get_request_id),
+    settings: Settings = Depends(get_app_settings)
+) -> ChatContext:
+    """
+    Get the chat manager, request ID and settings as one dependency.
+    
+    Args:
+        chat_manager: Chat management instance
+        request_id: Request identifier
+        settings: Application settings
+        
+    Returns:
+        ChatContext: Bundled request context
+    """
+    return ChatContext(chat_manager, request_id, settings)
+
+
+ChatContextDep = Annotated[ChatContext, Depends(get_chat_context)]
+
+
 # Request validation dependencies
 def validate_session_id(session_id: str) -> str:
     """
@@ -309,18 +403,62 @@ def check_rate_limit(
 
 
 # Health check dependencies
-def check_database_health(
+HEALTH_PROBE_TTL_SECONDS = 3.0
+
+
+def async_ttl_cache(ttl: float):
+    """
+    Reuse a health probe's last healthy result for ttl seconds.
+    
+    Arguments are ignored for the cache key since every call probes the same
+    backend. Unhealthy results and exceptions are never cached, so failures
+    show up on the next call.
+    
+    Args:
+        ttl: Seconds a healthy result stays valid
+        
+    Returns:
+        Decorator for async probe functions
+    """
+    def decorator(func):
+        cached = [0.0, None]  # [expiry, result]
+        
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            now = time.monotonic()
+            if cached[1] is not None and now < cached[0]:
+                return cached[1]
+            
+            cached[:] = [0.0, None]
+            result = await func(*args, **kwargs)
+            if result.get("status") == "healthy":
+                cached[:] = [now + ttl, result]
+            return result
+        
+        return wrapper
+    return decorator
+
+
+@async_ttl_cache(ttl=HEALTH_PROBE_TTL_SECONDS)
+async def check_database_health(
     db: Session = Depends(get_database_session)
 ) -> dict:
     """
     Check database health status.
     
+    The blocking ping runs in a worker thread so the event loop stays free.
+    
     Args:
         db: Database session
         
     Returns:
         dict: Database health information
     """
+    return await asyncio.to_thread(_ping_database, db)
+
+
+def _ping_database(db: Session) -> dict:
+    """Run the database connectivity query and describe the result"""
     try:
         # Simple query to test database connectivity
         db.execute("SELECT 1")
@@ -338,18 +476,26 @@ def check_database_health(
         }
 
 
-def check_llm_health(
+@async_ttl_cache(ttl=HEALTH_PROBE_TTL_SECONDS)
+async def check_llm_health(
     llm_factory: LLMFactory = Depends(get_llm_factory)
 ) -> dict:
     """
     Check LLM service health status.
     
+    Creating the LLM client may block, so it runs in a worker thread.
+    
     Args:
         llm_factory: LLM factory instance
         
     Returns:
         dict: LLM health information
     """
+    return await asyncio.to_thread(_probe_llm, llm_factory)
+
+
+def _probe_llm(llm_factory: LLMFactory) -> dict:
+    """Get the configured LLM and describe its availability"""
     try:
         llm = llm_factory.get_llm()
         # You could add a simple test call here
@@ -368,7 +514,8 @@ def check_llm_health(
         }
 
 
-def check_tools_health(
+@async_ttl_cache(ttl=HEALTH_PROBE_TTL_SECONDS)
+async def check_tools_health(
     tool_registry: ToolRegistry = Depends(get_tool_registry)
 ) -> dict:
     """
@@ -5,9 +5,11 @@ Amazon Nova LLM Provider
 Amazon Nova implementation using AWS Bedrock with converse API.
 """
 
+import asyncio
 import logging
 import json
-from typing import Dict, Any, List, Optional
+import threading
+from typing import AsyncIterator, Dict, Any, List, Optional
 import boto3
 from botocore.exceptions import ClientError, BotoCoreError
 
@@ -98,8 +100,10 @@ class AmazonNovaLLM(BaseLLM):
         """Generate response using Amazon Nova."""
         
         try:
-            # Use converse method and extract just the text
-            response = self.converse(
+            # Use converse method and extract just the text; the boto3 call
+            # blocks, so keep it off the event loop
+            response = await asyncio.to_thread(
+                self.converse,
                 messages=messages,
                 max_tokens=max_tokens,
                 temperature=temperature,
@@ -113,6 +117,73 @@ class AmazonNovaLLM(BaseLLM):
             logger.error(f"Failed to generate response with Amazon Nova: {str(e)}")
             raise LLMError(f"Response generation failed: {str(e)}")
     
+    async def generate_response_stream(
+        self,
+        messages: List[Dict[str, str]],
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        top_p: Optional[float] = None,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """Stream a response using the Bedrock converse_stream API."""
+        
+        if not self.is_initialized:
+            raise LLMError("Amazon Nova LLM not initialized")
+        
+        self.validate_messages(messages)
+        bedrock_messages = self._format_messages_for_bedrock(messages)
+        inference_config = self._prepare_inference_config(
+            max_tokens, temperature, top_p
+        )
+        
+        loop = asyncio.get_running_loop()
+        fragments: asyncio.Queue = asyncio.Queue()
+        stopped = threading.Event()
+        
+        def pump() -> None:
+            # The event stream is a blocking iterator, so read it in a worker
+            # thread and hand each text delta to the event loop
+            try:
+                response = self.bedrock_client.converse_stream(
+                    modelId=self.model_id,
+                    messages=bedrock_messages,
+                    inferenceConfig=inference_config,
+                    **kwargs
+                )
+                stream = response['stream']
+                for event in stream:
+                    if stopped.is_set():
+                        # Consumer went away - stop generating instead of draining
+                        stream.close()
+                        return
+                    text = event.get('contentBlockDelta', {}).get('delta', {}).get('text')
+                    if text:
+                        loop.call_soon_threadsafe(fragments.put_nowait, text)
+                loop.call_soon_threadsafe(fragments.put_nowait, None)
+            except Exception as e:
+                loop.call_soon_threadsafe(fragments.put_nowait, e)
+        
+        logger.debug(f"Calling Bedrock converse_stream API with {len(bedrock_messages)} messages")
+        reader = loop.run_in_executor(None, pump)
+        
+        try:
+            while True:
+                fragment = await fragments.get()
+                if fragment is None:
+                    break
+                if isinstance(fragment, ClientError):
+                    error_message = fragment.response['Error']['Message']
+                    logger.error(f"Bedrock streaming API error: {error_message}")
+                    raise LLMError(f"Bedrock error: {error_message}")
+                if isinstance(fragment, Exception):
+                    logger.error(f"Failed to stream response with Amazon Nova: {str(fragment)}")
+                    raise LLMError(f"Response streaming failed: {str(fragment)}")
+                yield fragment
+            
+            await reader
+        finally:
+            stopped.set()
+    
     def converse(
         self,
         messages: List[Dict[str, str]],
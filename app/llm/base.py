@@ -8,7 +8,7 @@ and response structures.
 
 import logging
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional, NamedTuple
+from typing import AsyncIterator, Dict, Any, List, Optional, NamedTuple
 from datetime import datetime
 
 from ..config import Settings
@@ -82,6 +82,41 @@ class BaseLLM(ABC):
         """
         pass
     
+    async def generate_response_stream(
+        self,
+        messages: List[Dict[str, str]],
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        top_p: Optional[float] = None,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """
+        Generate a response as a stream of text fragments.
+        
+        Providers with a streaming API should override this. The default
+        yields the whole generate_response result as a single fragment.
+        
+        Args:
+            messages: List of conversation messages
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            top_p: Top-p sampling parameter
+            **kwargs: Additional provider-specific parameters
+            
+        Yields:
+            Response text fragments, in order
+            
+        Raises:
+            LLMError: If generation fails
+        """
+        yield await self.generate_response(
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            top_p=top_p,
+            **kwargs
+        )
+    
     @abstractmethod
     def converse(
         self,
@@ -233,7 +268,7 @@ class BaseLLM(ABC):
             'provider': self.provider,
             'class': self.__class__.__name__,
             'initialized': self.is_initialized,
-            'supports_streaming': hasattr(self, 'stream_response'),
+            'supports_streaming': type(self).generate_response_stream is not BaseLLM.generate_response_stream,
             'supports_tools': hasattr(self, 'call_tool'),
             'default_parameters': self.get_default_parameters()
         }
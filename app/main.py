@@ -11,11 +11,12 @@ from typing import Optional
 
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 from .config import get_settings
 from .middleware.cors import get_cors_config
 from .middleware.logging import LoggingMiddleware
+from .middleware.request_id import RequestIDMiddleware
 from .utils.exceptions import ChatBotException, ValidationError, LLMError, ToolError, DatabaseError
 from .api import chat, health
 
@@ -49,6 +50,7 @@ def create_app(config_override: Optional[dict] = None) -> FastAPI:
         debug=settings.debug,
         docs_url="/docs" if settings.debug else None,
         redoc_url="/redoc" if settings.debug else None,
+        default_response_class=ORJSONResponse,
     )
     
     # Add CORS middleware
@@ -61,6 +63,9 @@ def create_app(config_override: Optional[dict] = None) -> FastAPI:
     # Add custom middleware
     app.add_middleware(LoggingMiddleware)
     
+    # Assign request IDs (added last so it wraps the other middleware)
+    app.add_middleware(RequestIDMiddleware)
+    
     # Configure exception handlers
     configure_exception_handlers(app)
     
@@ -0,0 +1,47 @@
+"""
+Request ID Middleware
+=====================
+
+Pure ASGI middleware that assigns every HTTP request an identifier and
+exposes it through a ContextVar, so handlers can read it without going
+through FastAPI dependency injection.
+"""
+
+import uuid
+from contextvars import ContextVar
+
+# Request ID of the request currently being handled ("" outside a request)
+request_id_var: ContextVar[str] = ContextVar("request_id", default="")
+
+# Longest client-supplied X-Request-ID that is accepted as-is
+MAX_REQUEST_ID_LENGTH = 128
+
+
+class RequestIDMiddleware:
+    """Set the request ID from the X-Request-ID header or a new UUID4"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                if len(value) <= MAX_REQUEST_ID_LENGTH:
+                    request_id = value.decode("latin-1")
+                break
+        if not request_id:
+            request_id = str(uuid.uuid4())
+
+        # Also expose it as request.state.request_id for get_request_id and exception handlers
+        scope.setdefault("state", {})["request_id"] = request_id
+
+        token = request_id_var.set(request_id)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            request_id_var.reset(token)
@@ -1,17 +1,33 @@
+from functools import lru_cache
+from typing import Sequence, Union
+
 import tiktoken
 
-def count_tokens(text: str, model_name: str = "cl100k_base", debug=False) -> int:
+
+@lru_cache(maxsize=None)
+def get_encoding(model_name: str = "cl100k_base") -> tiktoken.Encoding:
+    """
+    Returns the tiktoken encoding for model_name, built once per process.
+    """
+    return tiktoken.get_encoding(model_name)
+
+
+def count_tokens(text: Union[str, Sequence[int]], model_name: str = "cl100k_base", debug=False) -> int:
     """
     Calculates the number of tokens in a given text string using tiktoken.
     Args:
-        text (str): The input text to tokenize.
+        text (str | Sequence[int]): The input text to tokenize, or token ids
+                          that were already encoded (counted as-is).
         model_name (str): The encoding name or model name to use.
                           Defaults to "cl100k_base" which is used by models
                           like GPT-4, GPT-3.5-Turbo, and more.
     Returns:
         int: The number of tokens in the text.
     """
-    encoding = tiktoken.get_encoding(model_name)
+    if not isinstance(text, str):
+        return len(text)
+
+    encoding = get_encoding(model_name)
     token_integers = encoding.encode(text)
 
     if debug:
@@ -23,6 +39,21 @@ def count_tokens(text: str, model_name: str = "cl100k_base", debug=False) -> int
     return len(token_integers)
 
 
+@lru_cache(maxsize=4096)
+def count_message_tokens(role: str, content: str, model_name: str = "cl100k_base") -> int:
+    """
+    Counts the tokens of one "role: content" chat message.
+    Results are cached, so history messages resent on every turn are only
+    encoded the first time they are seen.
+    Args:
+        role (str): Message role (system, user or assistant).
+        content (str): Message text.
+        model_name (str): The encoding name to use.
+    Returns:
+        int: The number of tokens in the formatted message.
+    """
+    return len(get_encoding(model_name).encode(f"{role}: {content}"))
+
 if __name__ == "__main__":
     sample_text = "Hello, world! This is a test string to count tokens."
     print(f"Token Count : {count_tokens(text=sample_text, debug=False)}")
\ No newline at end of file
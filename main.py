@@ -10,14 +10,17 @@ Usage:
     uvicorn main:app --host 0.0.0.0 --port 8000 --reload
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 import uvicorn
 
 # Add app directory to Python path
@@ -27,18 +30,32 @@ from app.config import get_settings
 from app.database.connection import init_database
 from app.api import chat, health
 from app.middleware.logging import LoggingMiddleware
+from app.middleware.request_id import RequestIDMiddleware
 from app.utils.exceptions import ChatBotException
 from app.tools.tool_registry import initialize_tools
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('data/logs/app.log', mode='a'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+from app.dependencies import get_conversation_flow, get_guardrails, get_tool_detector
+
+# Configure logging: request handlers only enqueue records, and a background
+# listener thread does the formatting and file/stdout writes
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_handlers = [
+    logging.FileHandler('data/logs/app.log', mode='a'),
+    logging.StreamHandler(sys.stdout)
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+
+_log_queue = queue.SimpleQueue()
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
+
+log_listener = logging.handlers.QueueListener(_log_queue, *_log_handlers, respect_handler_level=True)
+log_listener.start()
+# Stopped at interpreter exit, not per lifespan, so logging keeps working
+# across repeated startups in one process; stop() flushes queued records
+atexit.register(log_listener.stop)
 
 logger = logging.getLogger(__name__)
 
@@ -74,6 +91,11 @@ async def lifespan(app: FastAPI):
         tool_count = await initialize_tools()
         logger.info(f"Initialized {tool_count} tools successfully")
         
+        # Build the shared conversation components once, ahead of the first request
+        get_tool_detector()
+        get_guardrails()
+        get_conversation_flow()
+        
         # Create logs directory if it doesn't exist
         Path("data/logs").mkdir(parents=True, exist_ok=True)
         
@@ -112,6 +134,7 @@ def create_app() -> FastAPI:
         lifespan=lifespan,
         docs_url="/docs" if settings.debug else None,
         redoc_url="/redoc" if settings.debug else None,
+        default_response_class=ORJSONResponse,
     )
     
     # Add CORS middleware
@@ -126,6 +149,9 @@ def create_app() -> FastAPI:
     # Add custom logging middleware
     app.add_middleware(LoggingMiddleware)
     
+    # Assign request IDs (added last so it wraps the other middleware)
+    app.add_middleware(RequestIDMiddleware)
+    
     # Include API routers
     app.include_router(
         health.router,
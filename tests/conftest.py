@@ -0,0 +1,232 @@
+"""
+Shared Test Fixtures
+====================
+
+Several modules of the app package (database, tools, exceptions, CORS and
+logging middleware, the GPT OSS provider) are still empty placeholders.
+Importing any part of the package imports all of them, so until they are
+filled in, minimal stand-ins for the names the rest of the package uses are
+registered here. A module that has real content is always used as-is.
+"""
+
+import sys
+import types
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import pytest
+from pydantic import BaseModel
+from sqlalchemy import Boolean, Column, DateTime, Integer, String, Text
+from sqlalchemy.orm import declarative_base
+
+APP_DIR = Path(__file__).resolve().parent.parent / "app"
+
+
+# app.utils.exceptions
+class ChatBotException(Exception):
+    status_code = 500
+    error_code = "CHATBOT_ERROR"
+    
+    def __init__(self, detail: str = "", **kwargs: Any):
+        super().__init__(detail)
+        self.detail = detail
+
+
+class ValidationError(ChatBotException):
+    status_code = 400
+    error_code = "VALIDATION_ERROR"
+
+
+class GuardrailsViolation(ValidationError):
+    error_code = "GUARDRAILS_VIOLATION"
+
+
+class LLMError(ChatBotException):
+    status_code = 503
+    error_code = "LLM_ERROR"
+
+
+class ToolError(ChatBotException):
+    error_code = "TOOL_ERROR"
+
+
+class DatabaseError(ChatBotException):
+    error_code = "DATABASE_ERROR"
+
+
+class ConfigurationError(ChatBotException):
+    error_code = "CONFIGURATION_ERROR"
+
+
+# app.database.schemas
+class ChatRequest(BaseModel):
+    session_id: str
+    message: str
+
+
+class ChatResponse(BaseModel):
+    response: str
+    input_tokens: int = 0
+    output_tokens: int = 0
+    tool_called: bool = False
+    tool_name: Optional[str] = None
+    session_id: str
+    processing_time: float = 0.0
+
+
+class ConversationMessage(BaseModel):
+    role: str
+    content: str
+    timestamp: Optional[datetime] = None
+    input_tokens: int = 0
+    output_tokens: int = 0
+    tool_name: Optional[str] = None
+
+
+# app.database.models
+Base = declarative_base()
+
+
+class ChatSession(Base):
+    __tablename__ = "chat_sessions"
+    
+    session_id = Column(String(100), primary_key=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    last_activity = Column(DateTime, default=datetime.utcnow)
+    is_active = Column(Boolean, default=True)
+
+
+class DBConversationMessage(Base):
+    __tablename__ = "conversation_messages"
+    
+    id = Column(Integer, primary_key=True)
+    session_id = Column(String(100), index=True)
+    role = Column(String(20))
+    content = Column(Text)
+    timestamp = Column(DateTime, default=datetime.utcnow)
+    input_tokens = Column(Integer, default=0)
+    output_tokens = Column(Integer, default=0)
+    tool_name = Column(String(100))
+
+
+class ErrorLog(Base):
+    __tablename__ = "error_logs"
+    
+    id = Column(Integer, primary_key=True)
+    session_id = Column(String(100))
+    error_message = Column(Text)
+    request_id = Column(String(100))
+    timestamp = Column(DateTime, default=datetime.utcnow)
+
+
+# app.tools.tool_registry
+class ToolRegistry:
+    _instance = None
+    
+    def __init__(self):
+        self.tools: Dict[str, Any] = {}
+    
+    @classmethod
+    def get_instance(cls) -> "ToolRegistry":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+    
+    def list_tools(self) -> Dict[str, Any]:
+        return dict(self.tools)
+    
+    def get_tool(self, name: str) -> Any:
+        return self.tools.get(name)
+    
+    def get_tool_info(self, name: str) -> Optional[Dict[str, Any]]:
+        tool = self.tools.get(name)
+        return None if tool is None else {"name": name, "description": getattr(tool, "description", "")}
+
+
+async def initialize_tools() -> int:
+    return len(ToolRegistry.get_instance().tools)
+
+
+# app.database.connection
+def get_db():
+    raise RuntimeError("No database is configured for tests")
+
+
+async def init_database() -> None:
+    return None
+
+
+# app.middleware.cors and app.middleware.logging
+def get_cors_config(settings) -> Dict[str, Any]:
+    return {
+        "allow_origins": settings.cors_origins,
+        "allow_credentials": True,
+        "allow_methods": ["*"],
+        "allow_headers": ["*"]
+    }
+
+
+class LoggingMiddleware:
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        await self.app(scope, receive, send)
+
+
+# app.llm.gpt_oss
+class GPTOssLLM:
+    pass
+
+
+_PLACEHOLDERS = {
+    "app.utils.exceptions": {
+        "ChatBotException": ChatBotException,
+        "ValidationError": ValidationError,
+        "GuardrailsViolation": GuardrailsViolation,
+        "LLMError": LLMError,
+        "ToolError": ToolError,
+        "DatabaseError": DatabaseError,
+        "ConfigurationError": ConfigurationError
+    },
+    "app.database.schemas": {
+        "ChatRequest": ChatRequest,
+        "ChatResponse": ChatResponse,
+        "ConversationMessage": ConversationMessage
+    },
+    "app.database.models": {
+        "Base": Base,
+        "ChatSession": ChatSession,
+        "ConversationMessage": DBConversationMessage,
+        "ErrorLog": ErrorLog
+    },
+    "app.database.connection": {"get_db": get_db, "init_database": init_database},
+    "app.tools.tool_registry": {"ToolRegistry": ToolRegistry, "initialize_tools": initialize_tools},
+    "app.middleware.cors": {"get_cors_config": get_cors_config},
+    "app.middleware.logging": {"LoggingMiddleware": LoggingMiddleware},
+    "app.llm.gpt_oss": {"GPTOssLLM": GPTOssLLM}
+}
+
+
+def _register_placeholders() -> None:
+    """Register a stand-in for each placeholder module that is still empty"""
+    for name, attrs in _PLACEHOLDERS.items():
+        path = APP_DIR.joinpath(*name.split(".")[1:]).with_suffix(".py")
+        if path.stat().st_size:
+            continue
+        module = types.ModuleType(name)
+        module.__file__ = str(path)
+        module.__dict__.update(attrs)
+        sys.modules[name] = module
+
+
+_register_placeholders()
+
+from app.config import Settings  # noqa: E402  (needs the placeholders above)
+
+
+@pytest.fixture
+def settings() -> Settings:
+    """Default application settings, independent of config.yaml"""
+    return Settings()
@@ -0,0 +1,124 @@
+"""
+Chat API Tests
+==============
+"""
+
+from typing import Any, Dict, List
+
+import orjson
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api import chat
+from app.dependencies import get_app_settings, get_chat_manager
+from app.middleware.request_id import RequestIDMiddleware
+from app.utils.exceptions import LLMError, ValidationError
+
+SESSION_ID = "user_12345_session_67890"
+
+
+class StreamingChatManager:
+    """Chat manager that streams scripted chunks, then optionally fails"""
+    
+    def __init__(self, chunks: List[Dict[str, Any]], error: Exception = None):
+        self.chunks = chunks
+        self.error = error
+        self.requests = []
+    
+    async def process_message_stream(self, chat_request):
+        self.requests.append(chat_request)
+        for chunk in self.chunks:
+            yield dict(chunk)
+        if self.error is not None:
+            raise self.error
+
+
+def _client(chat_manager, settings) -> TestClient:
+    app = FastAPI()
+    app.add_middleware(RequestIDMiddleware)
+    app.include_router(chat.router)
+    app.dependency_overrides[get_chat_manager] = lambda: chat_manager
+    app.dependency_overrides[get_app_settings] = lambda: settings
+    return TestClient(app)
+
+
+def _events(body: str) -> List[Dict[str, Any]]:
+    """Decode the JSON payloads of a server-sent event stream"""
+    events = []
+    for block in body.split("\n\n"):
+        if block:
+            assert block.startswith("data: ")
+            events.append(orjson.loads(block[len("data: "):]))
+    return events
+
+
+@pytest.fixture(autouse=True)
+def skip_request_validation(monkeypatch):
+    monkeypatch.setattr(chat, "validate_chat_request", lambda session_id, message, request, settings: (session_id, message))
+
+
+def test_stream_sends_tokens_then_done(settings):
+    manager = StreamingChatManager([
+        {"type": "token", "content": "Your order "},
+        {"type": "token", "content": "ships today."},
+        {"type": "done", "input_tokens": 12, "output_tokens": 4, "tool_called": False, "tool_name": None}
+    ])
+    client = _client(manager, settings)
+    
+    response = client.post(
+        "/chat/stream",
+        json={"session_id": SESSION_ID, "message": "Where is my order?"},
+        headers={"X-Request-ID": "req-stream-1"}
+    )
+    
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.headers["cache-control"] == "no-cache"
+    
+    events = _events(response.text)
+    assert [event["type"] for event in events] == ["token", "token", "done"]
+    assert "".join(event["content"] for event in events[:-1]) == "Your order ships today."
+    assert events[-1]["output_tokens"] == 4
+    assert events[-1]["request_id"] == "req-stream-1"
+    
+    assert manager.requests[0].session_id == SESSION_ID
+    assert manager.requests[0].message == "Where is my order?"
+
+
+def test_stream_failure_is_reported_in_band(settings):
+    manager = StreamingChatManager(
+        [{"type": "token", "content": "Let me check."}],
+        error=LLMError("provider timeout")
+    )
+    client = _client(manager, settings)
+    
+    response = client.post(
+        "/chat/stream",
+        json={"session_id": SESSION_ID, "message": "Where is my order?"},
+        headers={"X-Request-ID": "req-stream-2"}
+    )
+    
+    assert response.status_code == 200
+    
+    events = _events(response.text)
+    assert [event["type"] for event in events] == ["token", "error"]
+    assert "provider timeout" not in events[-1]["detail"]
+    assert events[-1]["request_id"] == "req-stream-2"
+
+
+def test_stream_rejects_invalid_request_before_streaming(settings, monkeypatch):
+    def reject(session_id, message, request, settings):
+        raise ValidationError("Message cannot be empty")
+    
+    monkeypatch.setattr(chat, "validate_chat_request", reject)
+    manager = StreamingChatManager([])
+    client = _client(manager, settings)
+    
+    response = client.post(
+        "/chat/stream",
+        json={"session_id": SESSION_ID, "message": "   "}
+    )
+    
+    assert response.status_code == 400
+    assert manager.requests == []
@@ -0,0 +1,40 @@
+"""
+Chat Manager Tests
+==================
+"""
+
+from app.core.chat_manager import _render_system_prefix
+
+
+class CountingRegistry:
+    """Tool registry that counts how often its tools are listed"""
+    
+    def __init__(self, tools):
+        self.tools = tools
+        self.list_calls = 0
+    
+    def list_tools(self):
+        self.list_calls += 1
+        return self.tools
+
+
+def test_system_prefix_lists_tools_once_per_registry():
+    registry = CountingRegistry({"delivery_tracker": {"description": "Track a delivery"}})
+    
+    first = _render_system_prefix(registry, True)
+    second = _render_system_prefix(registry, True)
+    
+    assert first is second
+    assert registry.list_calls == 1
+    assert "- delivery_tracker: Track a delivery" in first
+
+
+def test_system_prefix_reflects_chat_mode():
+    registry = CountingRegistry({})
+    
+    general = _render_system_prefix(registry, True)
+    tools_only = _render_system_prefix(registry, False)
+    
+    assert "Available tools" not in general
+    assert "decline general conversation" in tools_only
+    assert "decline general conversation" not in general
@@ -0,0 +1,139 @@
+"""
+Response Cache Tests
+====================
+"""
+
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from app.core import response_cache
+from app.core.response_cache import ResponseCache, create_response_cache
+from app.database.schemas import ConversationMessage
+
+
+class FakeRedis:
+    """In-memory stand-in for the redis asyncio client"""
+    
+    def __init__(self):
+        self.data = {}
+        self.expiry = {}
+    
+    async def get(self, key):
+        return self.data.get(key)
+    
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+        self.expiry[key] = ex
+
+
+class BrokenRedis:
+    """Client whose every call fails, as when Redis is unreachable"""
+    
+    async def get(self, key):
+        raise ConnectionError("redis unavailable")
+    
+    async def set(self, key, value, ex=None):
+        raise ConnectionError("redis unavailable")
+
+
+@pytest.fixture
+def client(monkeypatch):
+    fake = FakeRedis()
+    monkeypatch.setattr(response_cache, "redis_asyncio", SimpleNamespace(from_url=lambda url: fake))
+    return fake
+
+
+@pytest.fixture
+def cache(client, settings) -> ResponseCache:
+    settings.cache.enabled = True
+    settings.llm.history_window = 3
+    return ResponseCache(settings)
+
+
+def _message(role: str, content: str) -> ConversationMessage:
+    return ConversationMessage(role=role, content=content, timestamp=datetime.utcnow())
+
+
+def test_key_is_stable_for_the_same_turn(cache):
+    history = [_message("user", "hi"), _message("assistant", "hello")]
+    
+    first = cache.make_key("system", {"state": "greeting"}, history, "track my order")
+    second = cache.make_key("system", {"state": "greeting"}, list(history), "track my order")
+    
+    assert first == second
+    assert first.startswith("chat:")
+
+
+def test_key_changes_with_each_component(cache):
+    history = [_message("user", "hi")]
+    base = cache.make_key("system", {"state": "greeting"}, history, "track my order")
+    
+    assert cache.make_key("other system", {"state": "greeting"}, history, "track my order") != base
+    assert cache.make_key("system", {"state": "tracking"}, history, "track my order") != base
+    assert cache.make_key("system", {"state": "greeting"}, [_message("user", "hey")], "track my order") != base
+    assert cache.make_key("system", {"state": "greeting"}, history, "cancel my order") != base
+
+
+def test_key_covers_earlier_context_in_the_prompt_window(cache):
+    recent = [_message("user", "hi"), _message("assistant", "hello")]
+    
+    first = cache.make_key("system", {}, [_message("user", "my order is 111")] + recent, "question")
+    second = cache.make_key("system", {}, [_message("user", "my order is 222")] + recent, "question")
+    
+    assert first != second
+
+
+def test_key_ignores_history_the_prompt_drops(cache):
+    window = [_message("user", "hi"), _message("assistant", "hello"), _message("user", "help")]
+    
+    short = cache.make_key("system", {}, window, "question")
+    longer = cache.make_key("system", {}, [_message("user", "much earlier")] + window, "question")
+    
+    assert short == longer
+
+
+def test_set_then_get_round_trips(cache, client, settings):
+    response = {"response": "Your order ships today", "output_tokens": 5}
+    
+    async def run():
+        await cache.set("chat:key", response)
+        return await cache.get("chat:key")
+    
+    assert asyncio.run(run()) == response
+    assert client.expiry["chat:key"] == settings.cache.ttl_seconds
+
+
+def test_get_misses_return_none(cache):
+    assert asyncio.run(cache.get("chat:missing")) is None
+
+
+def test_redis_errors_are_treated_as_misses(cache):
+    cache._client = BrokenRedis()
+    
+    async def run():
+        await cache.set("chat:key", {"response": "ignored"})
+        return await cache.get("chat:key")
+    
+    assert asyncio.run(run()) is None
+
+
+def test_create_returns_none_when_disabled(client, settings):
+    settings.cache.enabled = False
+    
+    assert create_response_cache(settings) is None
+
+
+def test_create_returns_none_without_redis(monkeypatch, settings):
+    monkeypatch.setattr(response_cache, "redis_asyncio", None)
+    settings.cache.enabled = True
+    
+    assert create_response_cache(settings) is None
+
+
+def test_create_builds_cache_when_enabled(client, settings):
+    settings.cache.enabled = True
+    
+    assert isinstance(create_response_cache(settings), ResponseCache)
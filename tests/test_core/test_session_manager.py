@@ -0,0 +1,95 @@
+"""
+Session Manager Tests
+=====================
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import sessionmaker
+
+from app.core.session_manager import SessionManager
+from app.database.models import Base, ChatSession, ConversationMessage as DBMessage
+from app.utils.exceptions import DatabaseError
+
+START = datetime(2024, 1, 15, 10, 0, 0)
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def _add_session(db, session_id: str, minutes: int, messages: int = 0, is_active: bool = True) -> None:
+    """Add a session last active START + minutes, with the given number of messages"""
+    db.add(ChatSession(
+        session_id=session_id,
+        created_at=START,
+        last_activity=START + timedelta(minutes=minutes),
+        is_active=is_active
+    ))
+    for i in range(messages):
+        db.add(DBMessage(session_id=session_id, role="user", content=f"message {i}", timestamp=START))
+    db.commit()
+
+
+def test_summaries_are_newest_first_with_counts(db, settings):
+    _add_session(db, "session_old_aaaa", minutes=1, messages=2)
+    _add_session(db, "session_new_bbbb", minutes=5, messages=3)
+    _add_session(db, "session_empty_cc", minutes=3)
+    
+    summaries = asyncio.run(SessionManager(db, settings).list_session_summaries())
+    
+    assert summaries == [
+        ("session_new_bbbb", START, START + timedelta(minutes=5), True, 3),
+        ("session_empty_cc", START, START + timedelta(minutes=3), True, 0),
+        ("session_old_aaaa", START, START + timedelta(minutes=1), True, 2)
+    ]
+
+
+def test_counts_are_fetched_for_the_listed_page_only(db, settings):
+    for minutes in range(5):
+        _add_session(db, f"session_page_{minutes}", minutes=minutes, messages=1)
+    manager = SessionManager(db, settings)
+    manager.get_message_counts = AsyncMock(return_value={"session_page_2": 1})
+    
+    summaries = asyncio.run(manager.list_session_summaries(limit=2, offset=1))
+    
+    assert [row[0] for row in summaries] == ["session_page_3", "session_page_2"]
+    assert [row[4] for row in summaries] == [0, 1]
+    manager.get_message_counts.assert_awaited_once_with(["session_page_3", "session_page_2"])
+
+
+def test_inactive_sessions_are_listed_on_request(db, settings):
+    _add_session(db, "session_active_a", minutes=1)
+    _add_session(db, "session_closed_b", minutes=2, is_active=False)
+    manager = SessionManager(db, settings)
+    
+    active = asyncio.run(manager.list_session_summaries())
+    everything = asyncio.run(manager.list_session_summaries(active_only=False))
+    
+    assert [row[0] for row in active] == ["session_active_a"]
+    assert [row[0] for row in everything] == ["session_closed_b", "session_active_a"]
+
+
+def test_empty_listing(db, settings):
+    assert asyncio.run(SessionManager(db, settings).list_session_summaries()) == []
+
+
+def test_database_errors_are_wrapped(db, settings, monkeypatch):
+    def fail(*args, **kwargs):
+        raise SQLAlchemyError("connection lost")
+    
+    monkeypatch.setattr(db, "query", fail)
+    
+    with pytest.raises(DatabaseError):
+        asyncio.run(SessionManager(db, settings).list_session_summaries())
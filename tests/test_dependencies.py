@@ -0,0 +1,87 @@
+"""
+Dependency Tests
+================
+"""
+
+import asyncio
+
+import pytest
+
+from app.dependencies import async_ttl_cache
+
+
+class Probe:
+    """Health probe returning scripted results and counting its calls"""
+    
+    def __init__(self, *results):
+        self.results = list(results)
+        self.calls = 0
+    
+    async def __call__(self, resource=None):
+        self.calls += 1
+        result = self.results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+HEALTHY = {"status": "healthy", "message": "ok"}
+UNHEALTHY = {"status": "unhealthy", "message": "down"}
+
+
+def test_healthy_result_is_reused_within_ttl():
+    probe = Probe(HEALTHY)
+    cached = async_ttl_cache(ttl=60)(probe)
+    
+    async def run():
+        return [await cached("db-1"), await cached("db-2")]
+    
+    assert asyncio.run(run()) == [HEALTHY, HEALTHY]
+    assert probe.calls == 1
+
+
+def test_healthy_result_expires():
+    probe = Probe(HEALTHY, UNHEALTHY)
+    cached = async_ttl_cache(ttl=0)(probe)
+    
+    async def run():
+        return [await cached(), await cached()]
+    
+    assert asyncio.run(run()) == [HEALTHY, UNHEALTHY]
+    assert probe.calls == 2
+
+
+def test_unhealthy_result_is_not_cached():
+    probe = Probe(UNHEALTHY, HEALTHY)
+    cached = async_ttl_cache(ttl=60)(probe)
+    
+    async def run():
+        return [await cached(), await cached()]
+    
+    assert asyncio.run(run()) == [UNHEALTHY, HEALTHY]
+    assert probe.calls == 2
+
+
+def test_exception_is_raised_and_not_cached():
+    probe = Probe(HEALTHY, RuntimeError("probe crashed"), HEALTHY)
+    cached = async_ttl_cache(ttl=0)(probe)
+    
+    async def run():
+        await cached()
+        with pytest.raises(RuntimeError):
+            await cached()
+        return await cached()
+    
+    assert asyncio.run(run()) == HEALTHY
+    assert probe.calls == 3
+
+
+def test_wrapper_keeps_probe_metadata():
+    async def check_example_health() -> dict:
+        """Check example health"""
+        return HEALTHY
+    
+    cached = async_ttl_cache(ttl=60)(check_example_health)
+    
+    assert cached.__name__ == "check_example_health"
+    assert cached.__doc__ == "Check example health"
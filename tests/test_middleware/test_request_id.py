@@ -0,0 +1,74 @@
+"""
+Request ID Middleware Tests
+===========================
+"""
+
+import asyncio
+import uuid
+
+from app.middleware.request_id import MAX_REQUEST_ID_LENGTH, RequestIDMiddleware, request_id_var
+
+
+def _call(scope):
+    """Run the middleware around an app that records what it saw"""
+    seen = {}
+    
+    async def app(scope, receive, send):
+        seen["request_id"] = request_id_var.get()
+        seen["scope"] = scope
+    
+    asyncio.run(RequestIDMiddleware(app)(scope, None, None))
+    return seen
+
+
+def _http_scope(*headers):
+    return {"type": "http", "headers": list(headers)}
+
+
+def test_uses_client_request_id():
+    seen = _call(_http_scope((b"x-request-id", b"req-12345")))
+    
+    assert seen["request_id"] == "req-12345"
+    assert seen["scope"]["state"]["request_id"] == "req-12345"
+
+
+def test_generates_uuid_without_header():
+    seen = _call(_http_scope((b"user-agent", b"pytest")))
+    
+    assert uuid.UUID(seen["request_id"]).version == 4
+    assert seen["scope"]["state"]["request_id"] == seen["request_id"]
+
+
+def test_replaces_overlong_request_id():
+    overlong = b"x" * (MAX_REQUEST_ID_LENGTH + 1)
+    
+    seen = _call(_http_scope((b"x-request-id", overlong)))
+    
+    assert seen["request_id"] != overlong.decode()
+    assert uuid.UUID(seen["request_id"])
+
+
+def test_replaces_empty_request_id():
+    seen = _call(_http_scope((b"x-request-id", b"")))
+    
+    assert uuid.UUID(seen["request_id"])
+
+
+def test_each_request_gets_its_own_id():
+    first = _call(_http_scope())
+    second = _call(_http_scope())
+    
+    assert first["request_id"] != second["request_id"]
+
+
+def test_context_is_reset_after_request():
+    _call(_http_scope((b"x-request-id", b"req-12345")))
+    
+    assert request_id_var.get() == ""
+
+
+def test_non_http_scopes_pass_through():
+    seen = _call({"type": "lifespan"})
+    
+    assert seen["request_id"] == ""
+    assert "state" not in seen["scope"]